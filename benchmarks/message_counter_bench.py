@@ -0,0 +1,418 @@
+"""
+MESSAGE COUNTER BENCHMARK
+-------------------------
+
+Offline benchmark for message_counter.py. The script is loaded exactly as Nighty
+loads it, but with stand-ins for the Nighty globals (bot, forwardEmbedMethod,
+getConfigData/updateConfigData, getScriptsPath, nightyScript) and a simulated
+channel instead of Discord.
+
+The simulated channel:
+- Holds any number of synthetic, snowflake-ordered messages generated on the fly
+  (nothing is stored, so millions of messages cost no memory up front)
+- Serves the raw messages endpoint (bot.http.logs_from) as JSON text that is
+  decoded per page, like the real HTTP client does
+- Serves channel.history() with one model object per message, parsed from the
+  same payload (author, attachments, embeds, reactions, timestamp)
+- Adds a configurable per-page latency and injects 429s at a configurable rate,
+  sleeping for the retry delay and logging it the way discord.py does
+
+Time spent generating the synthetic pages is measured and excluded from
+msgs/sec, so it reflects the client side (decode, parse, count, index) plus the
+simulated network time. Wall time is reported as measured.
+
+Each strategy runs in its own subprocess so peak RSS is measured in isolation.
+
+Requires discord.py (or discord.py-self) to be installed, as in Nighty.
+
+USAGE:
+    python benchmarks/message_counter_bench.py
+    python benchmarks/message_counter_bench.py --messages 2000000 --latency 0.02 --rate-limit 0.01
+    python benchmarks/message_counter_bench.py --strategies light,parallel --json
+"""
+import argparse
+import asyncio
+import builtins
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "message_counter.py")
+
+DISCORD_EPOCH = 1420070400000
+
+# name -> (extra count arguments, run twice so the second run is measured)
+STRATEGIES = {
+    "scan": ("--mode=scan", False),
+    "light": ("--mode=light", False),
+    "parallel": ("--mode=parallel", False),
+    "index-cold": ("--mode=index", False),
+    "index-warm": ("--mode=index", True),
+    "filtered": ("--mode=light --no-bots", False),
+}
+
+PAYLOAD_TEMPLATE = (
+    '{{"id":"{id}","type":0,"channel_id":"{channel_id}","content":"synthetic message {index}",'
+    '"timestamp":"{timestamp}","edited_timestamp":null,"tts":false,"mention_everyone":false,'
+    '"author":{{"id":"{author_id}","username":"user{author_id}","global_name":"User {author_id}",'
+    '"avatar":"a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6","discriminator":"0","public_flags":0,"bot":{bot}}},'
+    '"attachments":{attachments},"embeds":{embeds},"mentions":[],"mention_roles":[],'
+    '"pinned":false,"flags":0,"components":[],"reactions":{reactions}}}'
+)
+ATTACHMENT_JSON = (
+    '[{{"id":"{id}","filename":"image.png","size":48213,"url":"https://cdn.discordapp.com/attachments/{channel_id}/{id}/image.png",'
+    '"proxy_url":"https://media.discordapp.net/attachments/{channel_id}/{id}/image.png","width":800,"height":600,"content_type":"image/png"}}]'
+)
+EMBED_JSON = '[{"type":"rich","title":"Embed title","description":"Embed description text","color":5793266,"fields":[{"name":"Field","value":"Value","inline":true}]}]'
+REACTION_JSON = '[{"emoji":{"id":null,"name":"\\ud83d\\udc4d"},"count":3,"me":false}]'
+
+
+class FakeChannel:
+    """Synthetic channel whose message i has snowflake ((start + i * step) << 22) | (i % 4096)"""
+
+    def __init__(self, channel_id, message_count, span_days):
+        self.id = channel_id
+        self.name = "benchmark"
+        self.guild = type("FakeGuild", (), {"id": 1, "name": "Benchmark Server"})()
+        self.message_count = message_count
+        now_ms = int(time.time() * 1000)
+        self.step_ms = max(1, span_days * 86400000 // max(message_count, 1))
+        self.start_offset = now_ms - DISCORD_EPOCH - self.step_ms * message_count
+
+    def message_id(self, index):
+        return ((self.start_offset + index * self.step_ms) << 22) | (index % 4096)
+
+    def first_index_after(self, message_id):
+        """Index of the first message with an ID greater than message_id"""
+        index = ((message_id >> 22) - self.start_offset) // self.step_ms
+        index = min(max(index, 0), self.message_count)
+        while index > 0 and self.message_id(index - 1) > message_id:
+            index -= 1
+        while index < self.message_count and self.message_id(index) <= message_id:
+            index += 1
+        return index
+
+    def payload_json(self, index):
+        message_id = self.message_id(index)
+        timestamp = datetime.fromtimestamp(((message_id >> 22) + DISCORD_EPOCH) / 1000, timezone.utc)
+        return PAYLOAD_TEMPLATE.format(
+            id=message_id,
+            channel_id=self.id,
+            index=index,
+            timestamp=timestamp.isoformat(),
+            author_id=100 + index % 7,
+            bot="true" if index % 5 == 0 else "false",
+            attachments=ATTACHMENT_JSON.format(id=message_id + 1, channel_id=self.id) if index % 9 == 0 else "[]",
+            embeds=EMBED_JSON if index % 13 == 0 else "[]",
+            reactions=REACTION_JSON if index % 4 == 0 else "[]"
+        )
+
+    def page_json(self, start, stop):
+        """Messages [start, stop) as the API returns them: JSON text, newest first"""
+        return "[" + ",".join(self.payload_json(index) for index in range(stop - 1, start - 1, -1)) + "]"
+
+
+class FakeAuthor:
+    def __init__(self, data):
+        self.id = int(data["id"])
+        self.name = data["username"]
+        self.display_name = data.get("global_name") or data["username"]
+        self.avatar = data.get("avatar")
+        self.bot = data.get("bot", False)
+
+
+class FakeMessage:
+    """Model object built from a payload, standing in for discord.Message's parsing work"""
+
+    def __init__(self, channel, data):
+        self.id = int(data["id"])
+        self.channel = channel
+        self.content = data["content"]
+        self.created_at = datetime.fromisoformat(data["timestamp"])
+        self.author = FakeAuthor(data["author"])
+        self.attachments = [dict(attachment) for attachment in data["attachments"]]
+        self.embeds = [dict(embed) for embed in data["embeds"]]
+        self.reactions = [dict(reaction) for reaction in data["reactions"]]
+        self.mentions = list(data["mentions"])
+        self.pinned = data["pinned"]
+
+
+class Simulator:
+    """Shared request accounting, latency and 429 injection for the fake API"""
+
+    def __init__(self, latency, rate_limit, retry_after, seed):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.rate_limited = 0
+        self.bytes_received = 0
+        self.generation_time = 0.0
+        self.logger = logging.getLogger("discord.http")
+
+    def page_json(self, channel, start, stop):
+        started = time.perf_counter()
+        text = channel.page_json(start, stop)
+        self.generation_time += time.perf_counter() - started
+        self.bytes_received += len(text)
+        return text
+
+    async def request(self, route):
+        """One API round trip; 429s are retried after a delay like discord.py does"""
+        while True:
+            self.requests += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            else:
+                await asyncio.sleep(0)
+            if self.rate_limit and self.random.random() < self.rate_limit:
+                self.rate_limited += 1
+                self.logger.warning(
+                    "We are being rate limited. GET %s responded with 429. Retrying in %.2f seconds.",
+                    route, self.retry_after
+                )
+                await asyncio.sleep(self.retry_after)
+                continue
+            return
+
+
+class FakeHTTP:
+    def __init__(self, simulator, channels):
+        self.simulator = simulator
+        self.channels = channels
+
+    async def logs_from(self, channel_id, limit, before=None, after=None, around=None):
+        channel = self.channels[int(channel_id)]
+        await self.simulator.request(f"/channels/{channel_id}/messages")
+        if after is not None:
+            start = channel.first_index_after(int(getattr(after, "id", after)))
+            stop = min(start + limit, channel.message_count)
+        else:
+            stop = channel.message_count
+            if before is not None:
+                stop = channel.first_index_after(int(getattr(before, "id", before)) - 1)
+            start = max(stop - limit, 0)
+        return json.loads(self.simulator.page_json(channel, start, stop))
+
+
+def attach_history(channel, simulator):
+    """Give the channel history() and fetch_message() backed by the same fake API"""
+
+    async def history(limit=100, before=None, after=None, around=None, oldest_first=None):
+        start = channel.first_index_after(after.id) if after is not None else 0
+        stop = channel.first_index_after(before.id - 1) if before is not None else channel.message_count
+        for page_start in range(start, stop, 100):
+            page_stop = min(page_start + 100, stop)
+            await simulator.request(f"/channels/{channel.id}/messages")
+            text = simulator.page_json(channel, page_start, page_stop)
+            for data in reversed(json.loads(text)):
+                yield FakeMessage(channel, data)
+
+    async def fetch_message(message_id):
+        await simulator.request(f"/channels/{channel.id}/messages/{message_id}")
+        index = channel.first_index_after(message_id - 1)
+        return FakeMessage(channel, json.loads(channel.payload_json(index)))
+
+    channel.history = history
+    channel.fetch_message = fetch_message
+
+
+class FakeBot:
+    def __init__(self, http, channels):
+        self.http = http
+        self.channels = channels
+        self.commands = {}
+        self.user = type("FakeUser", (), {"id": 100})()
+
+    def command(self, name=None, **kwargs):
+        def decorator(func):
+            self.commands[name or func.__name__] = func
+            return func
+        return decorator
+
+    def listen(self, name=None):
+        def decorator(func):
+            return func
+        return decorator
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+    def get_guild(self, guild_id):
+        return None
+
+
+class FakeSentMessage:
+    id = 0
+
+    async def edit(self, **kwargs):
+        pass
+
+    async def delete(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, channel):
+        self.channel = channel
+        self.guild = channel.guild
+        self.message = FakeSentMessage()
+
+    async def send(self, content=None, **kwargs):
+        return FakeSentMessage()
+
+
+def load_script(bot, data_dir, results):
+    """Execute message_counter.py with stand-ins for the Nighty globals"""
+    config = {"private": True}
+
+    async def forwardEmbedMethod(channel_id, content, title=None, **kwargs):
+        results.append(content)
+
+    def script_print(*args, type_=None, **kwargs):
+        if type_ == "ERROR":
+            builtins.print(*args, file=sys.stderr)
+
+    namespace = {
+        "__name__": "nighty_script",
+        "bot": bot,
+        "forwardEmbedMethod": forwardEmbedMethod,
+        "getConfigData": lambda: config,
+        "updateConfigData": config.__setitem__,
+        "getScriptsPath": lambda: data_dir,
+        "nightyScript": lambda **kwargs: (lambda func: func),
+        "print": script_print,
+    }
+    with open(SCRIPT_PATH, encoding="utf-8") as f:
+        exec(compile(f.read(), SCRIPT_PATH, "exec"), namespace)
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_strategy(name, args):
+    """Run one strategy in this process and return its measurements"""
+    extra_args, warm_up = STRATEGIES[name]
+    simulator = Simulator(args.latency, args.rate_limit, args.retry_after, args.seed)
+    channel = FakeChannel(1000, args.messages, args.span_days)
+    attach_history(channel, simulator)
+    channels = {channel.id: channel}
+    bot = FakeBot(FakeHTTP(simulator, channels), channels)
+    results = []
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        load_script(bot, data_dir, results)
+        count = bot.commands["count"]
+        target_id = channel.message_id(0)
+        command_args = f"{channel.id} {target_id} {extra_args} --workers={args.workers}"
+
+        if warm_up:
+            await count(FakeContext(channel), args=command_args)
+        requests_before = simulator.requests
+        rate_limited_before = simulator.rate_limited
+        bytes_before = simulator.bytes_received
+        generation_before = simulator.generation_time
+
+        started = time.perf_counter()
+        await count(FakeContext(channel), args=command_args)
+        wall_time = time.perf_counter() - started
+        client_time = max(wall_time - (simulator.generation_time - generation_before), 1e-9)
+
+    expected = channel.message_count - 1
+    if "--no-bots" in extra_args:
+        expected = sum(1 for index in range(1, channel.message_count) if index % 5 != 0)
+    reported = None
+    if results and "Messages after target: **" in results[-1]:
+        reported = int(results[-1].split("Messages after target: **")[1].split("**")[0].replace(",", ""))
+
+    return {
+        "strategy": name,
+        "messages": channel.message_count - 1,
+        "wall_time": wall_time,
+        "messages_per_second": (channel.message_count - 1) / client_time,
+        "peak_rss_mb": peak_rss_mb(),
+        "requests": simulator.requests - requests_before,
+        "rate_limited": simulator.rate_limited - rate_limited_before,
+        "bytes_received": simulator.bytes_received - bytes_before,
+        "correct": reported == expected,
+    }
+
+
+def run_in_subprocess(name, args):
+    command = [
+        sys.executable, os.path.abspath(__file__),
+        "--child", name,
+        "--messages", str(args.messages),
+        "--span-days", str(args.span_days),
+        "--latency", str(args.latency),
+        "--rate-limit", str(args.rate_limit),
+        "--retry-after", str(args.retry_after),
+        "--workers", str(args.workers),
+        "--seed", str(args.seed),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"strategy {name} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_table(rows):
+    header = f"{'strategy':<12} {'msgs/sec':>12} {'wall (s)':>10} {'peak RSS (MB)':>14} {'requests':>9} {'429s':>6} {'MB recv':>9} {'ok':>4}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['strategy']:<12} {row['messages_per_second']:>12,.0f} {row['wall_time']:>10.2f} "
+            f"{row['peak_rss_mb']:>14.1f} {row['requests']:>9,} {row['rate_limited']:>6,} "
+            f"{row['bytes_received'] / 1048576:>9.1f} {'yes' if row['correct'] else 'NO':>4}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for the message counter script")
+    parser.add_argument("--messages", type=int, default=1000000, help="synthetic messages in the channel")
+    parser.add_argument("--span-days", type=int, default=30, help="time span the messages are spread over")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="probability that a request gets a 429")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="seconds to wait after an injected 429")
+    parser.add_argument("--workers", type=int, default=4, help="--workers passed to the count command")
+    parser.add_argument("--seed", type=int, default=1, help="seed for 429 injection")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help="comma separated strategies to run")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    if args.child:
+        print(json.dumps(asyncio.run(run_strategy(args.child, args))))
+        return
+
+    names = [name.strip() for name in args.strategies.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategies: {', '.join(unknown)} (available: {', '.join(STRATEGIES)})")
+
+    rows = [run_in_subprocess(name, args) for name in names]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{args.messages:,} messages, {args.latency}s latency, {args.rate_limit:.1%} 429 rate, {args.workers} workers\n")
+        print_table(rows)
+    if not all(row["correct"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 @nightyScript(
-    name="Crypto Address Info v1.10",
+    name="Crypto Address Info v1.20",
     author="simnJS",
     description="Fetches information about cryptocurrency addresses.",
-    usage="<p>cryptoinfo <currency> <address>"
+    usage="<p>cryptoinfo <currency> <address> [details|txs]"
 )
 def CryptoScript():
     """
@@ -13,6 +13,12 @@ def CryptoScript():
     
     COMMANDS:
     <p>cryptoinfo <currency> <address>  - Search for a crypto address (BTC, LTC, ETH, etc.)
+    <p>cryptoinfo <currency> <address> details  - Also list recent transactions and compare payload sizes
+    <p>cryptoinfo <currency> <address> txs  - Page through the address's full transaction history
+    <p>cryptoinfo next  - Show the next page of the channel's transaction listing
+    <p>cryptoinfo batch <currency> <address> [address...] [<currency> <address>...]  - Summary table for many addresses
+    <p>cryptoinfo cache [clear]  - Show address cache statistics, or empty the cache
+    <p>cryptoinfo providers  - Show provider health, latency and rate limits
     
     SUPPORTED CURRENCIES:
     - BTC (Bitcoin)
@@ -26,17 +32,90 @@ def CryptoScript():
     
     EXAMPLES:
     <p>cryptoinfo btc 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa  - Shows BTC address info
-    <p>cryptoinfo eth 0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6  - Shows ETH address info
+    <p>cryptoinfo eth 0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed  - Shows ETH address info
+    <p>cryptoinfo batch btc 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa 3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy ltc LdP8Qox1VAhCzLJNqrr74YovaWYyNBUWvL
     
     NOTES:
     - Supports multiple major cryptocurrencies
     - Clean and fast address information lookup
+    - One pooled HTTP session is shared by every lookup, so warm lookups skip DNS/TCP/TLS setup
+    - Address data and EUR rate are fetched at the same time; a slow price never holds back the result
+    - EUR rates for every supported coin come from one shared snapshot refreshed in the background
+    - Repeat lookups of an address are answered from a cache (kept on disk across restarts)
+    - Batch lookups use multi-address endpoints, so N addresses cost about N / batch size requests
+    - Addresses are validated offline (Base58Check, Bech32/Bech32m, CashAddr, EIP-55) before any request
+    - Taproot (Bech32m) addresses go only to providers that index them, Esplora first
+    - Several providers per coin, ordered by health and latency; a second one is hedged in when the first is slow
+    - Requests are paced per provider host by a token bucket that backs off on 429 / Retry-After
+    - Lookups use balance-only endpoints; full transaction payloads are fetched only in details mode
+    - txs mode pages through history with provider cursors and prefetches the next page while you read
     
     API ENDPOINTS USED:
-    - https://blockchain.info/rawaddr/{address} - For Bitcoin addresses
-    - https://api.blockcypher.com/v1/{currency}/main/addrs/{address} - For other currencies
+    - https://blockchain.info/balance?active={address} - For Bitcoin addresses
+    - https://api.blockcypher.com/v1/{currency}/main/addrs/{address}/balance - For other currencies
+    - https://blockchain.info/rawaddr/{address}, https://api.blockcypher.com/v1/{currency}/main/addrs/{address} - Details mode
+    - https://blockstream.info/api/address/{address}, https://mempool.space/api/address/{address} - Bitcoin fallbacks
+    - https://litecoinspace.org/api/address/{address} - Litecoin fallback
+    - https://api.blockchair.com/{chain}/dashboards/address/{address} - Fallback for every coin but BTS
+    - https://blockchain.info/multiaddr?active={a|b|c} - Batch Bitcoin lookups
+    - https://api.blockcypher.com/v1/{currency}/main/addrs/{a;b;c}/balance - Batch lookups for other currencies
+    - rawaddr ?offset=, blockcypher ?before=, Esplora /txs/chain/{last_txid}, blockchair ?offset= - txs mode pages
     
     CHANGELOG:
+    v1.20 - Transaction browsing
+          - txs mode lists an address's history TX_PAGE_SIZE transactions per embed, with <p>cryptoinfo next
+          - Provider pages fetched with offset / before / last-txid cursors and reduced to hash, time and value
+          - The next page is prefetched in the background, so memory stays bounded on 100k+ transaction addresses
+
+    v1.19 - Lightweight endpoints
+          - Summary lookups use blockchain.info balance and blockcypher /balance instead of full address dumps
+          - Blockchair and Esplora lookups skip transaction lists unless details are asked for
+          - details mode lists recent transactions and reports payload size and latency against the balance endpoint
+
+    v1.18 - Rate limiting
+          - Token bucket per provider host with a bounded, prioritised wait queue
+          - 429 responses honour Retry-After, halve the host's rate and retry once; the rate recovers on success
+          - Single lookups go ahead of batch lookups, which go ahead of background price refreshes
+          - Cached results never wait on the limiter; an expired cache entry is served if every provider fails
+
+    v1.17 - Provider failover
+          - Provider registry with Esplora (blockstream, mempool, litecoinspace) and blockchair backends
+          - Providers ordered by health and median latency, with a cooldown after repeated failures
+          - Hedged requests: the next provider starts if the first hasn't answered within its p95
+          - Failures fail over immediately; provider health in <p>cryptoinfo providers
+
+    v1.16 - Offline address validation
+          - Base58Check for BTC/LTC/DOGE/DASH/ZEC/BCH, Bech32/Bech32m segwit, CashAddr and EIP-55
+          - Invalid input rejected with the reason before any network request
+          - CashAddr converted to the legacy form blockcypher expects; ETH normalised for the cache
+          - Address type shown in the embed
+
+    v1.15 - Batch lookups
+          - <p>cryptoinfo batch for many addresses, grouped by currency
+          - blockchain.info multiaddr and blockcypher a;b;c batches within each provider's limit
+          - Cached addresses skipped, one compact summary table per currency
+
+    v1.14 - Address cache
+          - Lookups cached by (currency, address) for ADDRESS_CACHE_TTL with an LRU size bound
+          - Optional SQLite persistence in json/cryptoinfo_cache.db so the cache survives restarts
+          - Data age shown for cached results; hit/miss counters in <p>cryptoinfo cache
+
+    v1.13 - Price snapshot cache
+          - EUR rates for all supported coins fetched in one batched CoinGecko request
+          - Background refresh every PRICE_REFRESH_SECONDS while lookups keep coming
+          - Stale rates served while a refresh runs, with their age shown in the embed
+
+    v1.12 - Concurrent lookups
+          - Address data and EUR rate requested at the same time
+          - Per-request deadlines; the address result is sent without EUR values if the price is late
+          - Added ADDRESS_DEADLINE_SECONDS, PRICE_DEADLINE_SECONDS and PRICE_GRACE_SECONDS
+
+    v1.11 - Shared HTTP session
+          - One long-lived aiohttp session instead of a new one per command
+          - Connection pool with per-host limits, keep-alive and DNS cache
+          - Explicit connect/read/total timeouts
+          - Previous session closed when the script is reloaded
+
     v1.10 - Added EURO conversion ( Thanks to 1gz )
 
     v1.0 - Initial release
@@ -46,41 +125,653 @@ def CryptoScript():
     """
     import aiohttp
     import asyncio
+    import contextlib
+    import contextvars
+    import hashlib
+    import heapq
+    import itertools
     import json
+    import os
+    import sqlite3
+    import time
+    from collections import OrderedDict, deque
     from datetime import datetime
+    from email.utils import parsedate_to_datetime
+    from urllib.parse import urlsplit
     
+    # "api" is the batch-capable backend; "providers" are tried for single lookups, best first
     SUPPORTED_CURRENCIES = {
-        "btc": {"name": "Bitcoin", "api": "blockchain", "divisor": 100000000},
-        "ltc": {"name": "Litecoin", "api": "blockcypher", "divisor": 100000000},
-        "eth": {"name": "Ethereum", "api": "blockcypher", "divisor": 1000000000000000000},
-        "bch": {"name": "Bitcoin Cash", "api": "blockcypher", "divisor": 100000000},
-        "doge": {"name": "Dogecoin", "api": "blockcypher", "divisor": 100000000},
-        "dash": {"name": "Dash", "api": "blockcypher", "divisor": 100000000},
-        "zec": {"name": "Zcash", "api": "blockcypher", "divisor": 100000000},
-        "bts": {"name": "BitShares", "api": "blockcypher", "divisor": 100000000}
+        "btc": {"name": "Bitcoin", "api": "blockchain", "divisor": 100000000, "coingecko": "bitcoin",
+                "providers": ["blockchain", "blockstream", "mempool", "blockcypher", "blockchair"]},
+        "ltc": {"name": "Litecoin", "api": "blockcypher", "divisor": 100000000, "coingecko": "litecoin",
+                "providers": ["blockcypher", "litecoinspace", "blockchair"]},
+        "eth": {"name": "Ethereum", "api": "blockcypher", "divisor": 1000000000000000000, "coingecko": "ethereum",
+                "providers": ["blockcypher", "blockchair"]},
+        "bch": {"name": "Bitcoin Cash", "api": "blockcypher", "divisor": 100000000, "coingecko": "bitcoin-cash",
+                "providers": ["blockcypher", "blockchair"]},
+        "doge": {"name": "Dogecoin", "api": "blockcypher", "divisor": 100000000, "coingecko": "dogecoin",
+                 "providers": ["blockcypher", "blockchair"]},
+        "dash": {"name": "Dash", "api": "blockcypher", "divisor": 100000000, "coingecko": "dash",
+                 "providers": ["blockcypher", "blockchair"]},
+        "zec": {"name": "Zcash", "api": "blockcypher", "divisor": 100000000, "coingecko": "zcash",
+                "providers": ["blockcypher", "blockchair"]},
+        "bts": {"name": "BitShares", "api": "blockcypher", "divisor": 100000000, "coingecko": "bitshares",
+                "providers": ["blockcypher"]}
+    }
+    
+    HTTP_HEADERS = {
+        "Accept": "application/json",
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    HTTP_POOL_LIMIT = 20  # open connections across all providers
+    HTTP_POOL_LIMIT_PER_HOST = 4  # open connections per provider host
+    HTTP_KEEPALIVE_SECONDS = 60  # idle time before a pooled connection is closed
+    HTTP_DNS_CACHE_SECONDS = 300
+    HTTP_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+    ADDRESS_DEADLINE_SECONDS = 12  # give up on the address lookup after this long
+    PRICE_DEADLINE_SECONDS = 4  # give up on the EUR rate after this long
+    PRICE_GRACE_SECONDS = 1  # once the address data is in, wait at most this long for the rate
+    PRICE_REFRESH_SECONDS = 120  # background refresh interval of the price snapshot
+    PRICE_MAX_AGE_SECONDS = 1800  # older snapshots are refetched before use instead of served stale
+    PRICE_IDLE_SECONDS = 900  # stop refreshing after this long without a lookup
+    
+    BATCH_MAX_ADDRESSES = 100  # addresses accepted by one batch command
+    BLOCKCHAIN_BATCH_SIZE = 50  # addresses per blockchain.info multiaddr request
+    BLOCKCYPHER_BATCH_SIZE = 3  # blockcypher's free tier allows 3 addresses per batch request
+    BATCH_CONCURRENCY = 2  # batch requests in flight at once
+    BATCH_TABLE_ROWS = 20  # rows shown per currency in the summary table
+    
+    PROVIDER_LATENCY_SAMPLES = 50  # recent latencies kept per provider
+    PROVIDER_DEFAULT_LATENCY = 1.0  # assumed latency (seconds) until a provider has samples
+    PROVIDER_HEDGE_MIN_SECONDS = 0.3  # never hedge sooner than this
+    PROVIDER_FAILURES_BEFORE_COOLDOWN = 3  # consecutive failures that bench a provider
+    PROVIDER_COOLDOWN_SECONDS = 60
+    
+    # Sustained requests per second and burst size per provider host, kept under the free tiers
+    HOST_RATE_LIMITS = {
+        "api.blockcypher.com": (3, 3),
+        "api.coingecko.com": (0.5, 5),
+        "api.blockchair.com": (0.5, 5),
+        "blockchain.info": (1, 5),
+        "blockstream.info": (5, 10),
+        "mempool.space": (5, 10),
+        "litecoinspace.org": (5, 10)
+    }
+    DEFAULT_HOST_RATE_LIMIT = (2, 5)
+    RATE_LIMIT_QUEUE_SIZE = 50  # requests allowed to wait per host before new ones fail fast
+    RATE_LIMIT_DEFAULT_BACKOFF = 10  # seconds to pause a host after a 429 without Retry-After
+    RATE_LIMIT_MAX_BACKOFF = 120
+    RATE_LIMIT_RETRIES = 1  # retries of a request answered with 429
+    
+    # Request priorities, lowest first: interactive lookups, batch lookups, background refreshes
+    PRIORITY_LOOKUP = 0
+    PRIORITY_BATCH = 1
+    PRIORITY_BACKGROUND = 2
+    
+    RECENT_TX_LIMIT = 5  # transactions listed in details mode
+    TX_PAGE_SIZE = 10  # transactions per embed in txs mode
+    TX_FETCH_SIZE = 25  # transactions requested per provider page
+    TX_BROWSER_TTL = 900  # seconds a txs session stays open for <p>cryptoinfo next
+    
+    BLOCKCHAIR_CHAINS = {
+        "btc": "bitcoin",
+        "ltc": "litecoin",
+        "eth": "ethereum",
+        "bch": "bitcoin-cash",
+        "doge": "dogecoin",
+        "dash": "dash",
+        "zec": "zcash"
+    }
+    
+    ADDRESS_CACHE_TTL = 300  # seconds an address lookup is reused
+    ADDRESS_CACHE_SIZE = 256  # addresses kept in memory
+    ADDRESS_CACHE_DISK_SIZE = 5000  # rows kept in the on-disk cache
+    ADDRESS_CACHE_PRUNE_EVERY = 50  # writes between on-disk prunes
+    CHECKSUM_CACHE_SIZE = 1024  # mixed-case EIP-55 addresses whose checksum result is kept
+    ADDRESS_CACHE_PERSIST = True  # also keep cached lookups on disk across restarts
+    ADDRESS_CACHE_PATH = os.path.join(getScriptsPath(), "json", "cryptoinfo_cache.db")
+    
+    # One EUR snapshot for every coin in SUPPORTED_CURRENCIES
+    price_snapshot = {
+        "rates": {},
+        "fetched_at": None,
+        "last_used": 0.0,
+        "refresh": None
     }
     
+    # blockchain.info and blockcypher can't be relied on for Bech32m (taproot and later witness versions);
+    # these backends index them, Esplora's stats endpoint being the cheapest
+    BECH32M_PROVIDERS = ["mempool", "blockstream", "litecoinspace", "blockchair"]
+    
+    # Offline address formats: Base58Check version prefixes, segwit HRPs and CashAddr prefixes
+    ADDRESS_FORMATS = {
+        "btc": {"base58": {b"\x00": "P2PKH", b"\x05": "P2SH"}, "bech32": "bc"},
+        "ltc": {"base58": {b"\x30": "P2PKH", b"\x32": "P2SH", b"\x05": "P2SH"}, "bech32": "ltc"},
+        "bch": {"base58": {b"\x00": "P2PKH", b"\x05": "P2SH"}, "cashaddr": "bitcoincash"},
+        "doge": {"base58": {b"\x1e": "P2PKH", b"\x16": "P2SH"}},
+        "dash": {"base58": {b"\x4c": "P2PKH", b"\x10": "P2SH"}},
+        "zec": {"base58": {b"\x1c\xb8": "P2PKH", b"\x1c\xbd": "P2SH"}},
+        "eth": {"hex": True}
+    }
+    
+    BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+    BASE58_VALUES = {char: value for value, char in enumerate(BASE58_ALPHABET)}
+    BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    BECH32_VALUES = {char: value for value, char in enumerate(BECH32_CHARSET)}
+    BECH32_CONSTANT = 1
+    BECH32M_CONSTANT = 0x2bc830a3
+    
+    def base58check_decode(text):
+        """Decode a Base58Check string to its payload, or None if the checksum fails"""
+        value = 0
+        for char in text:
+            if char not in BASE58_VALUES:
+                return None
+            value = value * 58 + BASE58_VALUES[char]
+        raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+        raw = b"\x00" * (len(text) - len(text.lstrip("1"))) + raw
+        if len(raw) < 5:
+            return None
+        payload, checksum = raw[:-4], raw[-4:]
+        if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+            return None
+        return payload
+    
+    def base58check_encode(payload):
+        raw = payload + hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+        value = int.from_bytes(raw, "big")
+        text = ""
+        while value:
+            value, remainder = divmod(value, 58)
+            text = BASE58_ALPHABET[remainder] + text
+        return "1" * (len(raw) - len(raw.lstrip(b"\x00"))) + text
+    
+    def convert_bits(data, from_bits, to_bits, pad):
+        accumulator = 0
+        bits = 0
+        result = []
+        max_value = (1 << to_bits) - 1
+        for value in data:
+            accumulator = (accumulator << from_bits) | value
+            bits += from_bits
+            while bits >= to_bits:
+                bits -= to_bits
+                result.append((accumulator >> bits) & max_value)
+        if pad and bits:
+            result.append((accumulator << (to_bits - bits)) & max_value)
+        elif not pad and (bits >= from_bits or (accumulator << (to_bits - bits)) & max_value):
+            return None
+        return result
+    
+    def bech32_polymod(values):
+        generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+        checksum = 1
+        for value in values:
+            top = checksum >> 25
+            checksum = (checksum & 0x1ffffff) << 5 ^ value
+            for i in range(5):
+                if (top >> i) & 1:
+                    checksum ^= generator[i]
+        return checksum
+    
+    def segwit_decode(hrp, text):
+        """Return the address type of a valid Bech32 (v0) / Bech32m (v1+) segwit address, or None"""
+        if text.lower() != text and text.upper() != text:
+            return None
+        text = text.lower()
+        separator = text.rfind("1")
+        if text[:separator] != hrp or len(text) > 90 or len(text) - separator < 8:
+            return None
+        if any(char not in BECH32_VALUES for char in text[separator + 1:]):
+            return None
+        data = [BECH32_VALUES[char] for char in text[separator + 1:]]
+        expanded = [ord(char) >> 5 for char in hrp] + [0] + [ord(char) & 31 for char in hrp]
+        constant = bech32_polymod(expanded + data)
+        if not data or constant not in (BECH32_CONSTANT, BECH32M_CONSTANT):
+            return None
+        
+        version = data[0]
+        program = convert_bits(data[1:-6], 5, 8, False)
+        if version > 16 or program is None or not 2 <= len(program) <= 40:
+            return None
+        if version == 0:
+            if constant != BECH32_CONSTANT or len(program) not in (20, 32):
+                return None
+            return "P2WPKH" if len(program) == 20 else "P2WSH"
+        if constant != BECH32M_CONSTANT:
+            return None
+        return "P2TR" if version == 1 and len(program) == 32 else f"Witness v{version}"
+    
+    def cashaddr_decode(prefix, text):
+        """Return (type, hash) of a valid CashAddr address, or None"""
+        if text.lower() != text and text.upper() != text:
+            return None
+        text = text.lower()
+        if ":" in text:
+            given_prefix, text = text.split(":", 1)
+            if given_prefix != prefix:
+                return None
+        if not text or any(char not in BECH32_VALUES for char in text):
+            return None
+        data = [BECH32_VALUES[char] for char in text]
+        
+        checksum = 1
+        for value in [ord(char) & 31 for char in prefix] + [0] + data:
+            top = checksum >> 35
+            checksum = ((checksum & 0x07ffffffff) << 5) ^ value
+            for bit, generator in enumerate([0x98f2bc8e61, 0x79b76d99e2, 0xf33e5fb3c4, 0xae2eabe2a8, 0x1e4f43e470]):
+                if (top >> bit) & 1:
+                    checksum ^= generator
+        if checksum ^ 1 or len(data) < 8:
+            return None
+        
+        payload = convert_bits(data[:-8], 5, 8, False)
+        if not payload or payload[0] & 0x07 or len(payload) != 21:
+            return None
+        address_type = (payload[0] >> 3) & 0x0f
+        if address_type not in (0, 1):
+            return None
+        return ("P2PKH" if address_type == 0 else "P2SH"), bytes(payload[1:])
+    
+    KECCAK_ROUND_CONSTANTS = [
+        0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+        0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+        0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+        0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+        0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+        0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008
+    ]
+    # Rho rotation and pi destination for each lane, lanes indexed x + 5 * y
+    KECCAK_ROTATIONS = [0, 1, 62, 28, 27, 36, 44, 6, 55, 20, 3, 10, 43, 25, 39, 41, 45, 15, 21, 8, 18, 2, 61, 56, 14]
+    KECCAK_PI = [(x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5)) for y in range(5) for x in range(5)]
+    
+    def keccak256(data):
+        """Keccak-256 as used by Ethereum (hashlib's sha3_256 pads differently)"""
+        mask = (1 << 64) - 1
+        rate = 136
+        padded = bytearray(data) + b"\x01" + b"\x00" * ((rate - (len(data) + 1) % rate) % rate)
+        padded[-1] |= 0x80
+        
+        lanes = [0] * 25
+        rotated = [0] * 25
+        for offset in range(0, len(padded), rate):
+            for i in range(rate // 8):
+                lanes[i] ^= int.from_bytes(padded[offset + 8 * i:offset + 8 * i + 8], "little")
+            for round_constant in KECCAK_ROUND_CONSTANTS:
+                columns = [lanes[x] ^ lanes[x + 5] ^ lanes[x + 10] ^ lanes[x + 15] ^ lanes[x + 20] for x in range(5)]
+                for x in range(5):
+                    right = columns[(x + 1) % 5]
+                    d = columns[(x - 1) % 5] ^ (((right << 1) | (right >> 63)) & mask)
+                    for y in range(0, 25, 5):
+                        lanes[x + y] ^= d
+                for source, target in KECCAK_PI:
+                    lane = lanes[source]
+                    shift = KECCAK_ROTATIONS[source]
+                    rotated[target] = ((lane << shift) | (lane >> (64 - shift))) & mask
+                for y in range(0, 25, 5):
+                    row = rotated[y:y + 5]
+                    for x in range(5):
+                        lanes[x + y] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+                lanes[0] ^= round_constant
+        
+        return b"".join(lane.to_bytes(8, "little") for lane in lanes[:4])
+    
+    checksum_cache = OrderedDict()
+    
+    def eip55_checksum_ok(body):
+        """Check a mixed-case hex body against its EIP-55 checksum, remembering the result per address"""
+        if body in checksum_cache:
+            checksum_cache.move_to_end(body)
+            return checksum_cache[body]
+        digest = keccak256(body.lower().encode()).hex()
+        valid = all(
+            not char.isalpha() or char.isupper() == (int(nibble, 16) >= 8)
+            for char, nibble in zip(body, digest)
+        )
+        checksum_cache[body] = valid
+        while len(checksum_cache) > CHECKSUM_CACHE_SIZE:
+            checksum_cache.popitem(last=False)
+        return valid
+    
+    def validate_address(currency, address):
+        """Check an address offline and pick the form and providers to send it to.
+        
+        Returns {"address", "type", "api", "providers"}, where "api" is the batch backend (None when
+        no multi-address endpoint supports the type); raises ValueError with the reason for invalid input.
+        """
+        formats = ADDRESS_FORMATS.get(currency)
+        api = SUPPORTED_CURRENCIES[currency]["api"]
+        providers = SUPPORTED_CURRENCIES[currency]["providers"]
+        
+        if formats is None:
+            # BitShares has account names rather than checksummed addresses
+            if len(address) < 20:
+                raise ValueError("too short")
+            return {"address": address, "type": "Account", "api": api, "providers": providers}
+        
+        if formats.get("hex"):
+            body = address[2:] if address[:2] in ("0x", "0X") else None
+            if body is None or len(body) != 40 or any(char not in "0123456789abcdefABCDEF" for char in body):
+                raise ValueError("expected 0x followed by 40 hex characters")
+            if body != body.lower() and body != body.upper() and not eip55_checksum_ok(body):
+                raise ValueError("EIP-55 checksum mismatch")
+            # Lowercase is what the provider stores, and keeps cache keys stable
+            return {"address": "0x" + body.lower(), "type": "EIP-55", "api": api, "providers": providers}
+        
+        hrp = formats.get("bech32")
+        if hrp and address.lower().startswith(hrp + "1"):
+            address_type = segwit_decode(hrp, address)
+            if address_type is None:
+                raise ValueError("invalid Bech32/Bech32m checksum or program")
+            if address_type not in ("P2WPKH", "P2WSH"):
+                api = None
+                providers = [name for name in providers if name in BECH32M_PROVIDERS]
+            return {"address": address.lower(), "type": address_type, "api": api, "providers": providers}
+        
+        prefix = formats.get("cashaddr")
+        if prefix and (address.lower().startswith(prefix + ":") or address[:1] in "qpQP"):
+            decoded = cashaddr_decode(prefix, address)
+            if decoded is None:
+                raise ValueError("invalid CashAddr checksum")
+            address_type, hash_bytes = decoded
+            # blockcypher indexes Bitcoin Cash by legacy address, so convert before the request
+            version = b"\x00" if address_type == "P2PKH" else b"\x05"
+            return {"address": base58check_encode(version + hash_bytes), "type": f"CashAddr {address_type}", "api": api, "providers": providers}
+        
+        payload = base58check_decode(address)
+        if payload is None:
+            if currency == "zec" and address.lower().startswith("zs"):
+                raise ValueError("shielded addresses can't be looked up")
+            raise ValueError("invalid Base58Check checksum")
+        for version, address_type in formats["base58"].items():
+            if payload.startswith(version) and len(payload) == len(version) + 20:
+                return {"address": address, "type": address_type, "api": api, "providers": providers}
+        raise ValueError(f"not a {SUPPORTED_CURRENCIES[currency]['name']} address")
+    
+    address_cache = OrderedDict()
+    address_cache_stats = {"hits": 0, "misses": 0, "writes": 0}
+    
+    def open_address_cache():
+        """Open (and create if needed) the on-disk address cache"""
+        os.makedirs(os.path.dirname(ADDRESS_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(ADDRESS_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS address_cache ("
+            "currency TEXT NOT NULL, address TEXT NOT NULL, fetched_at REAL NOT NULL, data TEXT NOT NULL, "
+            "PRIMARY KEY (currency, address))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS address_cache_age ON address_cache (fetched_at)")
+        prune_address_cache(conn)
+        return conn
+    
+    def prune_address_cache(conn):
+        """Drop expired rows and keep only the newest ADDRESS_CACHE_DISK_SIZE"""
+        conn.execute("DELETE FROM address_cache WHERE fetched_at < ?", (time.time() - ADDRESS_CACHE_TTL,))
+        conn.execute(
+            "DELETE FROM address_cache WHERE rowid IN "
+            "(SELECT rowid FROM address_cache ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+            (ADDRESS_CACHE_DISK_SIZE,)
+        )
+        conn.commit()
+    
+    address_cache_db = None
+    if ADDRESS_CACHE_PERSIST:
+        try:
+            address_cache_db = open_address_cache()
+        except Exception as e:
+            print(f"Address cache persistence disabled: {str(e)}", type_="WARNING")
+    
+    def address_cache_get(currency, address, allow_stale=False):
+        """Return (data, age in seconds) for a cached lookup, or None.
+        
+        Expired entries stay until evicted so allow_stale can fall back to them when providers fail.
+        """
+        key = (currency, address)
+        entry = address_cache.get(key)
+        if entry is None and address_cache_db is not None:
+            row = address_cache_db.execute(
+                "SELECT fetched_at, data FROM address_cache WHERE currency = ? AND address = ?", key
+            ).fetchone()
+            if row:
+                entry = {"fetched_at": row[0], "data": json.loads(row[1])}
+                address_cache_store(key, entry)
+        
+        if entry is None or (time.time() - entry["fetched_at"] > ADDRESS_CACHE_TTL and not allow_stale):
+            if not allow_stale:
+                address_cache_stats["misses"] += 1
+            return None
+        
+        address_cache.move_to_end(key)
+        if not allow_stale:
+            address_cache_stats["hits"] += 1
+        return entry["data"], time.time() - entry["fetched_at"]
+    
+    def address_cache_store(key, entry):
+        """Insert into the in-memory LRU, evicting the least recently used entries"""
+        address_cache[key] = entry
+        address_cache.move_to_end(key)
+        while len(address_cache) > ADDRESS_CACHE_SIZE:
+            address_cache.popitem(last=False)
+    
+    def address_cache_put(currency, address, data):
+        key = (currency, address)
+        entry = {"fetched_at": time.time(), "data": data}
+        address_cache_store(key, entry)
+        
+        if address_cache_db is not None:
+            try:
+                address_cache_db.execute(
+                    "INSERT OR REPLACE INTO address_cache (currency, address, fetched_at, data) VALUES (?, ?, ?, ?)",
+                    (currency, address, entry["fetched_at"], json.dumps(data))
+                )
+                address_cache_db.commit()
+                address_cache_stats["writes"] += 1
+                if address_cache_stats["writes"] % ADDRESS_CACHE_PRUNE_EVERY == 0:
+                    prune_address_cache(address_cache_db)
+            except Exception as e:
+                print(f"Error saving address cache: {str(e)}", type_="WARNING")
+    
+    def address_cache_clear():
+        address_cache.clear()
+        if address_cache_db is not None:
+            address_cache_db.execute("DELETE FROM address_cache")
+            address_cache_db.commit()
+    
+    def get_session():
+        """Return the script's pooled HTTP session, creating it on first use"""
+        session = getattr(bot, "_cryptoinfo_session", None)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+                ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+                enable_cleanup_closed=True
+            )
+            session = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT, headers=HTTP_HEADERS)
+            bot._cryptoinfo_session = session
+        return session
+    
+    request_priority = contextvars.ContextVar("cryptoinfo_request_priority", default=PRIORITY_LOOKUP)
+    request_tickets = itertools.count()
+    rate_limiters = {}
+    
+    def get_rate_limiter(host):
+        if host not in rate_limiters:
+            rate, burst = HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE_LIMIT)
+            rate_limiters[host] = {
+                "rate": rate,
+                "max_rate": rate,
+                "burst": burst,
+                "tokens": burst,
+                "updated": time.monotonic(),
+                "blocked_until": 0.0,
+                "queue": [],
+                "changed": asyncio.Event(),
+                "requests": 0,
+                "throttled": 0
+            }
+        return rate_limiters[host]
+    
+    async def acquire_request_slot(host):
+        """Wait for a token from the host's bucket, in priority order"""
+        limiter = get_rate_limiter(host)
+        if len(limiter["queue"]) >= RATE_LIMIT_QUEUE_SIZE:
+            raise RuntimeError(f"{host} request queue is full")
+        
+        ticket = (request_priority.get(), next(request_tickets))
+        heapq.heappush(limiter["queue"], ticket)
+        try:
+            while True:
+                if limiter["queue"][0] != ticket:
+                    # Not our turn yet; wake up whenever a request ahead of us leaves the queue
+                    await limiter["changed"].wait()
+                    continue
+                
+                now = time.monotonic()
+                limiter["tokens"] = min(limiter["burst"], limiter["tokens"] + (now - limiter["updated"]) * limiter["rate"])
+                limiter["updated"] = now
+                wait = limiter["blocked_until"] - now
+                if limiter["tokens"] < 1:
+                    wait = max(wait, (1 - limiter["tokens"]) / limiter["rate"])
+                if wait <= 0:
+                    limiter["tokens"] -= 1
+                    limiter["requests"] += 1
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            limiter["queue"].remove(ticket)
+            heapq.heapify(limiter["queue"])
+            limiter["changed"].set()
+            limiter["changed"] = asyncio.Event()
+    
+    def parse_retry_after(value):
+        if not value:
+            return RATE_LIMIT_DEFAULT_BACKOFF
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return RATE_LIMIT_DEFAULT_BACKOFF
+        return min(max(seconds, 0), RATE_LIMIT_MAX_BACKOFF)
+    
+    endpoint_stats = {}
+    
+    def get_endpoint_stats(provider, details):
+        """Request/byte/time totals for one provider endpoint, summary or details"""
+        return endpoint_stats.setdefault((provider, details), {"requests": 0, "bytes": 0, "seconds": 0.0})
+    
+    async def read_json(response, stats=None):
+        """Parse a JSON body, counting its size into the endpoint's stats"""
+        body = await response.read()
+        if stats is not None:
+            stats["bytes"] += len(body)
+        return json.loads(body)
+    
+    @contextlib.asynccontextmanager
+    async def limited_get(session, url, stats=None, **kwargs):
+        """session.get behind the host's rate limiter; 429s pause the host, slow it down and retry.
+        
+        With stats, the request's time from leaving the queue to the end of the block is recorded.
+        """
+        host = urlsplit(url).hostname
+        limiter = get_rate_limiter(host)
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await acquire_request_slot(host)
+            started = time.monotonic()
+            response = await session.get(url, **kwargs)
+            if response.status == 429:
+                backoff = parse_retry_after(response.headers.get("Retry-After"))
+                limiter["throttled"] += 1
+                limiter["blocked_until"] = max(limiter["blocked_until"], time.monotonic() + backoff)
+                limiter["rate"] = max(limiter["rate"] / 2, limiter["max_rate"] / 16)
+                limiter["tokens"] = 0
+                print(f"{host} rate limited, pausing {backoff:.0f}s at {limiter['rate']:.2f} req/s", type_="WARNING")
+                if attempt < RATE_LIMIT_RETRIES:
+                    response.release()
+                    continue
+            else:
+                limiter["rate"] = min(limiter["max_rate"], limiter["rate"] + limiter["max_rate"] / 10)
+            break
+        try:
+            yield response
+        finally:
+            response.release()
+            if stats is not None:
+                stats["requests"] += 1
+                stats["seconds"] += time.monotonic() - started
+    
+    # A reload leaves the previous session and refresh task on the bot; close them so nothing leaks
+    previous_session = getattr(bot, "_cryptoinfo_session", None)
+    if previous_session is not None:
+        bot._cryptoinfo_session = None
+        if not previous_session.closed:
+            bot.loop.create_task(previous_session.close())
+    previous_refresher = getattr(bot, "_cryptoinfo_price_refresher", None)
+    if previous_refresher is not None and not previous_refresher.done():
+        previous_refresher.cancel()
+    bot._cryptoinfo_price_refresher = None
+
+    async def with_deadline(coro, seconds, label):
+        """Await a provider call, returning None once its deadline passes"""
+        try:
+            return await asyncio.wait_for(coro, timeout=seconds)
+        except asyncio.TimeoutError:
+            print(f"{label} took longer than {seconds}s, skipping", type_="WARNING")
+            return None
 
+    def parse_iso_time(value):
+        """Unix time from an ISO 8601 timestamp, or None"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
 
-    async def get_bitcoin_info(session, address):
-        url = f"https://blockchain.info/rawaddr/{address}"
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    def parse_address_data(data, currency, address):
+        """Normalise a provider's address object (amounts in base units) to coin amounts"""
+        divisor = SUPPORTED_CURRENCIES[currency]["divisor"]
+        return {
+            "address": data.get("address", address),
+            "balance": data.get("final_balance", 0) / divisor,
+            "total_received": data.get("total_received", 0) / divisor,
+            "total_sent": data.get("total_sent", 0) / divisor,
+            "n_tx": data.get("n_tx", 0),
+            "currency": currency.upper()
         }
+
+    async def get_bitcoin_info(session, address, details=False):
+        """blockchain.info balance endpoint, or rawaddr with recent transactions in details mode"""
+        stats = get_endpoint_stats("blockchain", details)
+        if details:
+            url = f"https://blockchain.info/rawaddr/{address}"
+            params = {"limit": RECENT_TX_LIMIT}
+        else:
+            url = "https://blockchain.info/balance"
+            params = {"active": address}
         
         try:
-            async with session.get(url, headers=headers) as response:
+            async with limited_get(session, url, stats=stats, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "address": data.get("address", address),
-                        "balance": data.get("final_balance", 0) / 100000000,
-                        "total_received": data.get("total_received", 0) / 100000000,
-                        "total_sent": data.get("total_sent", 0) / 100000000,
-                        "n_tx": data.get("n_tx", 0),
-                        "currency": "BTC"
-                    }
+                    data = await read_json(response, stats)
+                    if details:
+                        address_data = parse_address_data(data, "btc", address)
+                        address_data["recent_txs"] = [
+                            {"hash": tx.get("hash"), "time": tx.get("time")} for tx in data.get("txs", [])[:RECENT_TX_LIMIT]
+                        ]
+                        return address_data
+                    # The balance endpoint has no total_sent; it's whatever left the address
+                    entry = data.get(address) or next(iter(data.values()), {})
+                    return parse_address_data({
+                        "address": address,
+                        "final_balance": entry.get("final_balance", 0),
+                        "total_received": entry.get("total_received", 0),
+                        "total_sent": entry.get("total_received", 0) - entry.get("final_balance", 0),
+                        "n_tx": entry.get("n_tx", 0)
+                    }, "btc", address)
                 else:
                     print(f"Error fetching Bitcoin info: Status {response.status}", type_="ERROR")
                     return None
@@ -88,28 +779,27 @@ def CryptoScript():
             print(f"Error fetching Bitcoin info: {str(e)}", type_="ERROR")
             return None
 
-    async def get_blockcypher_info(session, currency, address):
-        url = f"https://api.blockcypher.com/v1/{currency}/main/addrs/{address}"
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
+    async def get_blockcypher_info(session, currency, address, details=False):
+        """blockcypher balance endpoint, or the full address resource in details mode"""
+        stats = get_endpoint_stats("blockcypher", details)
+        if details:
+            url = f"https://api.blockcypher.com/v1/{currency}/main/addrs/{address}"
+            params = {"limit": RECENT_TX_LIMIT}
+        else:
+            url = f"https://api.blockcypher.com/v1/{currency}/main/addrs/{address}/balance"
+            params = None
         
         try:
-            async with session.get(url, headers=headers) as response:
+            async with limited_get(session, url, stats=stats, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    
-                    divisor = SUPPORTED_CURRENCIES[currency]["divisor"]
-                    
-                    return {
-                        "address": data.get("address", address),
-                        "balance": data.get("final_balance", 0) / divisor,
-                        "total_received": data.get("total_received", 0) / divisor,
-                        "total_sent": data.get("total_sent", 0) / divisor,
-                        "n_tx": data.get("n_tx", 0),
-                        "currency": currency.upper()
-                    }
+                    data = await read_json(response, stats)
+                    address_data = parse_address_data(data, currency, address)
+                    if details:
+                        address_data["recent_txs"] = [
+                            {"hash": tx.get("tx_hash"), "time": parse_iso_time(tx.get("confirmed"))}
+                            for tx in data.get("txrefs", [])[:RECENT_TX_LIMIT]
+                        ]
+                    return address_data
                 else:
                     print(f"Error fetching {currency} info: Status {response.status}", type_="ERROR")
                     return None
@@ -117,47 +807,815 @@ def CryptoScript():
             print(f"Error fetching {currency} info: {str(e)}", type_="ERROR")
             return None
 
-    async def get_eur_conversion_rate(session, currency_symbol):
-        """Get EUR conversion rate for a cryptocurrency"""
-        url = f"https://api.coingecko.com/api/v3/simple/price"
-        
-        coingecko_ids = {
-            "BTC": "bitcoin",
-            "LTC": "litecoin", 
-            "ETH": "ethereum",
-            "BCH": "bitcoin-cash",
-            "DOGE": "dogecoin",
-            "DASH": "dash",
-            "ZEC": "zcash",
-            "BTS": "bitshares"
-        }
+    async def get_esplora_info(session, provider, base_url, currency, address, details=False):
+        """Esplora (blockstream/mempool-style) address stats, confirmed plus mempool"""
+        stats = get_endpoint_stats(provider, details)
+        url = f"{base_url}/address/{address}"
         
-        currency_id = coingecko_ids.get(currency_symbol.upper())
-        if not currency_id:
-            return None
+        try:
+            async with limited_get(session, url, stats=stats) as response:
+                if response.status == 200:
+                    data = await read_json(response, stats)
+                    chain = data.get("chain_stats", {})
+                    mempool = data.get("mempool_stats", {})
+                    received = chain.get("funded_txo_sum", 0) + mempool.get("funded_txo_sum", 0)
+                    sent = chain.get("spent_txo_sum", 0) + mempool.get("spent_txo_sum", 0)
+                    address_data = parse_address_data({
+                        "address": data.get("address", address),
+                        "final_balance": received - sent,
+                        "total_received": received,
+                        "total_sent": sent,
+                        "n_tx": chain.get("tx_count", 0) + mempool.get("tx_count", 0)
+                    }, currency, address)
+                else:
+                    print(f"Error fetching {currency} info from {base_url}: Status {response.status}", type_="ERROR")
+                    return None
             
-        params = {
-            "ids": currency_id,
-            "vs_currencies": "eur"
+            if details:
+                # Stats never include transactions; the newest ones are a separate listing
+                async with limited_get(session, f"{url}/txs", stats=stats) as response:
+                    if response.status != 200:
+                        print(f"Error fetching {currency} transactions from {base_url}: Status {response.status}", type_="ERROR")
+                        return None
+                    txs = await read_json(response, stats)
+                    address_data["recent_txs"] = [
+                        {"hash": tx.get("txid"), "time": (tx.get("status") or {}).get("block_time")}
+                        for tx in txs[:RECENT_TX_LIMIT]
+                    ]
+            return address_data
+        except Exception as e:
+            print(f"Error fetching {currency} info from {base_url}: {str(e)}", type_="ERROR")
+            return None
+
+    async def get_blockchair_info(session, currency, address, details=False):
+        """blockchair address dashboard, without its transaction list unless in details mode"""
+        stats = get_endpoint_stats("blockchair", details)
+        url = f"https://api.blockchair.com/{BLOCKCHAIR_CHAINS[currency]}/dashboards/address/{address}"
+        
+        try:
+            async with limited_get(session, url, stats=stats, params={"limit": RECENT_TX_LIMIT if details else 0}) as response:
+                if response.status == 200:
+                    data = await read_json(response, stats)
+                    dashboard = next(iter((data.get("data") or {}).values()), {})
+                    entry = dashboard.get("address") or {}
+                    # Ethereum dashboards only report approximate totals, in wei strings
+                    received = entry.get("received", entry.get("received_approximate")) or 0
+                    sent = entry.get("spent", entry.get("spent_approximate")) or 0
+                    address_data = parse_address_data({
+                        "address": address,
+                        "final_balance": int(float(entry.get("balance") or 0)),
+                        "total_received": int(float(received)),
+                        "total_sent": int(float(sent)),
+                        "n_tx": entry.get("transaction_count") or 0
+                    }, currency, address)
+                    if details:
+                        address_data["recent_txs"] = [
+                            {"hash": tx if isinstance(tx, str) else tx.get("transaction_hash") or tx.get("hash"), "time": None}
+                            for tx in (dashboard.get("transactions") or dashboard.get("calls") or [])[:RECENT_TX_LIMIT]
+                        ]
+                    return address_data
+                else:
+                    print(f"Error fetching {currency} info from blockchair: Status {response.status}", type_="ERROR")
+                    return None
+        except Exception as e:
+            print(f"Error fetching {currency} info from blockchair: {str(e)}", type_="ERROR")
+            return None
+
+    async def get_bitcoin_txs(session, currency, address, cursor):
+        """One page of blockchain.info rawaddr transactions; the cursor is an offset"""
+        offset = cursor or 0
+        url = f"https://blockchain.info/rawaddr/{address}"
+        params = {"limit": TX_FETCH_SIZE, "offset": offset}
+        
+        async with limited_get(session, url, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Status {response.status}")
+            data = await read_json(response)
+        txs = data.get("txs", [])
+        items = [{"hash": tx.get("hash"), "time": tx.get("time"), "value": tx.get("result")} for tx in txs]
+        done = len(txs) < TX_FETCH_SIZE or offset + len(txs) >= data.get("n_tx", 0)
+        return items, None if done else offset + len(txs), data.get("n_tx")
+
+    async def get_blockcypher_txs(session, currency, address, cursor):
+        """One page of blockcypher txrefs; the cursor is (block height, hashes already shown at it)"""
+        height, seen = cursor or (None, set())
+        url = f"https://api.blockcypher.com/v1/{currency}/main/addrs/{address}"
+        params = {"limit": TX_FETCH_SIZE}
+        if height is not None:
+            # before= is exclusive, so ask from the boundary block again and skip what was shown
+            params["before"] = height + 1
+        
+        async with limited_get(session, url, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Status {response.status}")
+            data = await read_json(response)
+        
+        # txrefs has one entry per input/output touching the address; fold them per transaction
+        items = {}
+        lowest = None
+        for ref in data.get("txrefs", []):
+            tx_hash = ref.get("tx_hash")
+            value = ref.get("value", 0) if ref.get("tx_input_n", -1) < 0 else -ref.get("value", 0)
+            lowest = ref.get("block_height") if lowest is None else min(lowest, ref.get("block_height", lowest))
+            if tx_hash in seen:
+                continue
+            if tx_hash in items:
+                items[tx_hash]["value"] += value
+            else:
+                items[tx_hash] = {"hash": tx_hash, "time": parse_iso_time(ref.get("confirmed")), "value": value}
+        
+        if not data.get("hasMore") or lowest is None:
+            return list(items.values()), None, data.get("n_tx")
+        if not items:
+            # One block holds more references than a page; skip past it rather than loop
+            return [], (lowest - 1, set()), data.get("n_tx")
+        boundary = {item["hash"] for item in items.values()} | (seen if lowest == height else set())
+        return list(items.values()), (lowest, boundary), data.get("n_tx")
+
+    async def get_esplora_txs(session, base_url, currency, address, cursor):
+        """One page of confirmed Esplora transactions; the cursor is the last txid shown"""
+        url = f"{base_url}/address/{address}/txs/chain" + (f"/{cursor}" if cursor else "")
+        
+        async with limited_get(session, url) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Status {response.status}")
+            txs = await read_json(response)
+        
+        items = []
+        for tx in txs:
+            received = sum(out.get("value", 0) for out in tx.get("vout", []) if out.get("scriptpubkey_address") == address)
+            sent = sum(
+                (vin.get("prevout") or {}).get("value", 0) for vin in tx.get("vin", [])
+                if (vin.get("prevout") or {}).get("scriptpubkey_address") == address
+            )
+            items.append({"hash": tx.get("txid"), "time": (tx.get("status") or {}).get("block_time"), "value": received - sent})
+        # Esplora pages are a fixed 25 transactions
+        return items, txs[-1]["txid"] if len(txs) >= 25 else None, None
+
+    async def get_blockchair_txs(session, currency, address, cursor):
+        """One page of a blockchair dashboard's transactions; the cursor is an offset"""
+        offset = cursor or 0
+        url = f"https://api.blockchair.com/{BLOCKCHAIR_CHAINS[currency]}/dashboards/address/{address}"
+        params = {"limit": TX_FETCH_SIZE, "offset": offset}
+        
+        async with limited_get(session, url, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Status {response.status}")
+            data = await read_json(response)
+        dashboard = next(iter((data.get("data") or {}).values()), {})
+        txs = dashboard.get("transactions") or dashboard.get("calls") or []
+        items = [
+            {"hash": tx, "time": None, "value": None} if isinstance(tx, str)
+            # Blockchair times are UTC without an offset
+            else {"hash": tx.get("transaction_hash"), "time": parse_iso_time(f"{tx['time'].replace(' ', 'T')}Z" if tx.get("time") else None), "value": None}
+            for tx in txs
+        ]
+        return items, None if len(txs) < TX_FETCH_SIZE else offset + len(txs), (dashboard.get("address") or {}).get("transaction_count")
+
+    PROVIDERS = {
+        "blockchain": {
+            "label": "blockchain.info",
+            "fetch": lambda session, currency, address, details: get_bitcoin_info(session, address, details),
+            "txs": get_bitcoin_txs
+        },
+        "blockcypher": {
+            "label": "blockcypher.com",
+            "fetch": get_blockcypher_info,
+            "txs": get_blockcypher_txs
+        },
+        "blockstream": {
+            "label": "blockstream.info",
+            "fetch": lambda session, currency, address, details: get_esplora_info(session, "blockstream", "https://blockstream.info/api", currency, address, details),
+            "txs": lambda session, currency, address, cursor: get_esplora_txs(session, "https://blockstream.info/api", currency, address, cursor)
+        },
+        "mempool": {
+            "label": "mempool.space",
+            "fetch": lambda session, currency, address, details: get_esplora_info(session, "mempool", "https://mempool.space/api", currency, address, details),
+            "txs": lambda session, currency, address, cursor: get_esplora_txs(session, "https://mempool.space/api", currency, address, cursor)
+        },
+        "litecoinspace": {
+            "label": "litecoinspace.org",
+            "fetch": lambda session, currency, address, details: get_esplora_info(session, "litecoinspace", "https://litecoinspace.org/api", currency, address, details),
+            "txs": lambda session, currency, address, cursor: get_esplora_txs(session, "https://litecoinspace.org/api", currency, address, cursor)
+        },
+        "blockchair": {
+            "label": "blockchair.com",
+            "fetch": get_blockchair_info,
+            "txs": get_blockchair_txs
         }
+    }
+    
+    provider_health = {}
+    
+    def get_provider_health(name):
+        return provider_health.setdefault(name, {
+            "latencies": deque(maxlen=PROVIDER_LATENCY_SAMPLES),
+            "successes": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "cooldown_until": 0.0
+        })
+    
+    def provider_latency(name, quantile):
+        latencies = sorted(get_provider_health(name)["latencies"])
+        if not latencies:
+            return PROVIDER_DEFAULT_LATENCY
+        return latencies[round(quantile * (len(latencies) - 1))]
+    
+    def record_provider_result(name, seconds, ok):
+        health = get_provider_health(name)
+        if ok:
+            health["latencies"].append(seconds)
+            health["successes"] += 1
+            health["consecutive_failures"] = 0
+        else:
+            health["failures"] += 1
+            health["consecutive_failures"] += 1
+            if health["consecutive_failures"] >= PROVIDER_FAILURES_BEFORE_COOLDOWN:
+                health["cooldown_until"] = time.monotonic() + PROVIDER_COOLDOWN_SECONDS
+                print(f"{PROVIDERS[name]['label']} failing, benched for {PROVIDER_COOLDOWN_SECONDS}s", type_="WARNING")
+    
+    def order_providers(currency, providers=None):
+        """Healthy providers by median latency, benched ones last"""
+        now = time.monotonic()
+        return sorted(
+            providers or SUPPORTED_CURRENCIES[currency]["providers"],
+            key=lambda name: (get_provider_health(name)["cooldown_until"] > now, provider_latency(name, 0.5))
+        )
+    
+    async def lookup_address(session, currency, address, details=False, providers=None):
+        """Fetch address data from the best provider, hedging and failing over to the others.
+        
+        Returns (data, provider name), or (None, None) if every provider failed.
+        """
+        providers = order_providers(currency, providers)
+        pending = {}
+        launched = []
+        winner = None
+        
+        async def attempt(name):
+            started = time.monotonic()
+            data = await PROVIDERS[name]["fetch"](session, currency, address, details)
+            record_provider_result(name, time.monotonic() - started, data is not None)
+            return data
+        
+        def launch():
+            name = providers[len(launched)]
+            launched.append(name)
+            pending[asyncio.ensure_future(attempt(name))] = (name, time.monotonic())
+        
+        try:
+            while True:
+                if not pending:
+                    if len(launched) == len(providers):
+                        return None, None
+                    launch()
+                
+                # Hedge with the next provider once the newest attempt runs past its usual p95
+                hedge_after = None
+                if len(launched) < len(providers):
+                    hedge_after = max(provider_latency(launched[-1], 0.95), PROVIDER_HEDGE_MIN_SECONDS)
+                done, _ = await asyncio.wait(pending, timeout=hedge_after, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    launch()
+                    print(f"{PROVIDERS[launched[-2]]['label']} is slow, hedging with {PROVIDERS[launched[-1]]['label']}", type_="INFO")
+                    continue
+                
+                for task in done:
+                    name, _ = pending.pop(task)
+                    data = task.result()
+                    if data:
+                        winner = name
+                        return data, name
+        finally:
+            # An attempt the hedge beat was at least as slow as it got, so that elapsed time is kept as a
+            # censored sample; hedges that lost only show they started late and record nothing
+            for task, (name, started) in pending.items():
+                task.cancel()
+                if winner is not None and launched.index(name) < launched.index(winner):
+                    get_provider_health(name)["latencies"].append(time.monotonic() - started)
+
+    async def get_bitcoin_batch(session, addresses):
+        """Look up several Bitcoin addresses with one multiaddr request"""
+        url = "https://blockchain.info/multiaddr"
+        params = {"active": "|".join(addresses), "n": 0}
+        
+        try:
+            async with limited_get(session, url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        item["address"]: parse_address_data(item, "btc", item["address"])
+                        for item in data.get("addresses", [])
+                        if "address" in item
+                    }
+                else:
+                    print(f"Error fetching Bitcoin batch: Status {response.status}", type_="ERROR")
+                    return {}
+        except Exception as e:
+            print(f"Error fetching Bitcoin batch: {str(e)}", type_="ERROR")
+            return {}
+
+    async def get_blockcypher_batch(session, currency, addresses):
+        """Look up several addresses with one semicolon-separated blockcypher request"""
+        url = f"https://api.blockcypher.com/v1/{currency}/main/addrs/{';'.join(addresses)}/balance"
+        
+        try:
+            async with limited_get(session, url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    # A single address comes back as an object rather than a list
+                    items = data if isinstance(data, list) else [data]
+                    return {
+                        item["address"]: parse_address_data(item, currency, item["address"])
+                        for item in items
+                        if "address" in item and "error" not in item
+                    }
+                else:
+                    print(f"Error fetching {currency} batch: Status {response.status}", type_="ERROR")
+                    return {}
+        except Exception as e:
+            print(f"Error fetching {currency} batch: {str(e)}", type_="ERROR")
+            return {}
+
+    async def fetch_batch(session, currency, api, addresses):
+        """Look up addresses for one currency in provider-sized chunks; returns address -> data"""
+        if api == "blockchain":
+            batch_size = BLOCKCHAIN_BATCH_SIZE
+        else:
+            batch_size = BLOCKCYPHER_BATCH_SIZE
+        chunks = [addresses[i:i + batch_size] for i in range(0, len(addresses), batch_size)]
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def fetch_chunk(chunk):
+            async with semaphore:
+                if api == "blockchain":
+                    return await get_bitcoin_batch(session, chunk)
+                return await get_blockcypher_batch(session, currency, chunk)
         
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        # Providers may echo addresses in another form (blockcypher drops ETH's 0x and checksum case)
+        returned = {}
+        for chunk_results in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+            for returned_address, data in chunk_results.items():
+                returned[batch_key(returned_address)] = data
+        
+        results = {}
+        for address in addresses:
+            data = returned.get(batch_key(address))
+            if data:
+                results[address] = dict(data, address=address)
+        return results, len(chunks)
+
+    async def fetch_singly(session, currency, addresses, routes):
+        """Batch fallback for address types without a multi-address endpoint; returns address -> data"""
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def fetch_one(address):
+            async with semaphore:
+                data, _ = await lookup_address(session, currency, address, providers=routes[(currency, address)]["providers"])
+                return address, data
+        
+        results = {}
+        for address, data in await asyncio.gather(*(fetch_one(address) for address in addresses)):
+            if data:
+                results[address] = data
+        return results, len(addresses)
+
+    def batch_key(address):
+        address = address.lower()
+        return address[2:] if address.startswith("0x") else address
+
+    def shorten_address(address):
+        return address if len(address) <= 16 else f"{address[:8]}…{address[-6:]}"
+
+    async def fetch_price_snapshot(session):
+        """Fetch EUR rates for every supported coin in one request"""
+        if price_snapshot["fetched_at"] is not None:
+            # Revalidating a snapshot that is still being served can wait behind lookups
+            request_priority.set(PRIORITY_BACKGROUND)
+        url = "https://api.coingecko.com/api/v3/simple/price"
+        params = {
+            "ids": ",".join(config["coingecko"] for config in SUPPORTED_CURRENCIES.values()),
+            "vs_currencies": "eur"
         }
         
         try:
-            async with session.get(url, params=params, headers=headers) as response:
+            async with limited_get(session, url, params=params) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return data.get(currency_id, {}).get("eur")
+                    price_snapshot["rates"] = {
+                        currency: data[config["coingecko"]]["eur"]
+                        for currency, config in SUPPORTED_CURRENCIES.items()
+                        if data.get(config["coingecko"], {}).get("eur") is not None
+                    }
+                    price_snapshot["fetched_at"] = time.monotonic()
+                    return True
                 else:
-                    print(f"Error fetching EUR rate for {currency_symbol}: Status {response.status}", type_="WARNING")
-                    return None
+                    print(f"Error fetching EUR rates: Status {response.status}", type_="WARNING")
+                    return False
         except Exception as e:
-            print(f"Error fetching EUR rate for {currency_symbol}: {str(e)}", type_="WARNING")
+            print(f"Error fetching EUR rates: {str(e)}", type_="WARNING")
+            return False
+    
+    def refresh_price_snapshot(session):
+        """Start a snapshot refresh, or join the one already running"""
+        if price_snapshot["refresh"] is None or price_snapshot["refresh"].done():
+            price_snapshot["refresh"] = asyncio.ensure_future(fetch_price_snapshot(session))
+        return price_snapshot["refresh"]
+    
+    async def price_refresh_loop():
+        """Keep the snapshot warm while lookups keep coming"""
+        while time.monotonic() - price_snapshot["last_used"] < PRICE_IDLE_SECONDS:
+            await asyncio.sleep(PRICE_REFRESH_SECONDS)
+            await asyncio.shield(refresh_price_snapshot(get_session()))
+        bot._cryptoinfo_price_refresher = None
+    
+    def price_age():
+        if price_snapshot["fetched_at"] is None:
+            return None
+        return time.monotonic() - price_snapshot["fetched_at"]
+    
+    async def get_eur_conversion_rate(session, currency_symbol):
+        """Get EUR conversion rate and its age in seconds from the shared snapshot"""
+        currency = currency_symbol.lower()
+        price_snapshot["last_used"] = time.monotonic()
+        
+        refresher = getattr(bot, "_cryptoinfo_price_refresher", None)
+        if refresher is None or refresher.done():
+            bot._cryptoinfo_price_refresher = asyncio.ensure_future(price_refresh_loop())
+        
+        age = price_age()
+        if age is None or age > PRICE_MAX_AGE_SECONDS:
+            # Nothing usable yet: wait for the refresh (shielded so a deadline doesn't cancel it for others)
+            await asyncio.shield(refresh_price_snapshot(session))
+        elif age > PRICE_REFRESH_SECONDS:
+            # Serve the stale rate now and revalidate in the background
+            refresh_price_snapshot(session)
+        
+        rate = price_snapshot["rates"].get(currency)
+        if rate is None:
+            return None
+        return rate, price_age()
+    
+    def format_age(seconds):
+        if seconds < 60:
+            return "just now"
+        if seconds < 3600:
+            return f"{int(seconds // 60)}m ago"
+        if seconds < 86400:
+            return f"{int(seconds // 3600)}h ago"
+        return f"{int(seconds // 86400)}d ago"
+    
+    def format_bytes(value):
+        if value >= 1048576:
+            return f"{value / 1048576:.1f} MB"
+        if value >= 1024:
+            return f"{value / 1024:.1f} KB"
+        return f"{int(value)} B"
+    
+    def format_endpoint_average(provider, details):
+        stats = endpoint_stats.get((provider, details))
+        if not stats or not stats["requests"]:
             return None
+        return f"≈{format_bytes(stats['bytes'] / stats['requests'])} / {stats['seconds'] / stats['requests'] * 1000:.0f} ms"
+    
+    def format_endpoint_comparison(provider):
+        """Average details payload against the balance endpoint of the same provider"""
+        detailed = format_endpoint_average(provider, True)
+        summary = format_endpoint_average(provider, False)
+        if detailed is None:
+            return "n/a"
+        text = f"details {detailed} per request"
+        if summary is None:
+            return text + " • balance endpoint not measured yet"
+        details_bytes = endpoint_stats[(provider, True)]["bytes"] / endpoint_stats[(provider, True)]["requests"]
+        summary_bytes = endpoint_stats[(provider, False)]["bytes"] / endpoint_stats[(provider, False)]["requests"]
+        ratio = f" ({details_bytes / summary_bytes:.0f}× larger)" if summary_bytes else ""
+        return text + f" • balance endpoint {summary}{ratio}"
+
+
+
+    def format_batch_table(currency, addresses, results, eur_rate):
+        """Summary block for one currency's batch results"""
+        symbol = currency.upper()
+        precision = 6 if currency == "eth" else 8
+        found = [results[address] for address in addresses if address in results]
+        total = sum(data["balance"] for data in found)
+        total_eur = f" (≈ €{total * eur_rate:,.2f})" if eur_rate and total > 0 else ""
+        
+        rows = []
+        for address in addresses[:BATCH_TABLE_ROWS]:
+            data = results.get(address)
+            if data:
+                rows.append(f"{shorten_address(address):<16} {data['balance']:>18.{precision}f} {data['n_tx']:>7}")
+            else:
+                rows.append(f"{shorten_address(address):<16} {'not found':>18} {'-':>7}")
+        if len(addresses) > BATCH_TABLE_ROWS:
+            rows.append(f"... and {len(addresses) - BATCH_TABLE_ROWS} more")
+        
+        table = "\n".join([f"{'Address':<16} {'Balance':>18} {'Txs':>7}"] + rows)
+        return f"""**{SUPPORTED_CURRENCIES[currency]['name']} ({symbol}):** {len(found)}/{len(addresses)} found • Total **{total:.{precision}f} {symbol}**{total_eur}
+```
+{table}
+```"""
+
+    async def batch_lookup(ctx, tokens):
+        """Look up many addresses, grouped by the currency token that precedes them"""
+        request_priority.set(PRIORITY_BATCH)
+        groups = {}
+        routes = {}
+        currency = None
+        invalid = []
+        for token in tokens:
+            if token.lower() in SUPPORTED_CURRENCIES:
+                currency = token.lower()
+                continue
+            if currency is None:
+                invalid.append(token)
+                continue
+            try:
+                validated = validate_address(currency, token)
+            except ValueError:
+                invalid.append(token)
+                continue
+            address = validated["address"]
+            if address not in groups.setdefault(currency, []):
+                groups[currency].append(address)
+                routes[(currency, address)] = validated
+        
+        address_count = sum(len(addresses) for addresses in groups.values())
+        if not address_count:
+            supported_list = ", ".join(SUPPORTED_CURRENCIES.keys()).upper()
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content=f"❌ **Usage:** `<p>cryptoinfo batch <currency> <address> [address...] [<currency> <address>...]`\n\n**Supported currencies:** {supported_list}",
+                title="Crypto Address Info"
+            )
+            return
+        
+        if address_count > BATCH_MAX_ADDRESSES:
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content=f"❌ **Too many addresses:** {address_count} (max {BATCH_MAX_ADDRESSES} per batch)",
+                title="Crypto Address Info"
+            )
+            return
+        
+        print(f"Batch lookup of {address_count} address(es) in {len(groups)} currency group(s)", type_="INFO")
+        
+        msg = await ctx.send(f"Getting information for {address_count} address(es), please wait...")
+        
+        current_private = getConfigData().get("private")
+        updateConfigData("private", False)
+        
+        try:
+            session = get_session()
+            price_task = asyncio.create_task(with_deadline(
+                get_eur_conversion_rate(session, next(iter(groups))),
+                PRICE_DEADLINE_SECONDS,
+                "EUR rates"
+            ))
+            
+            results = {}
+            cached_count = 0
+            request_count = 0
+            
+            async def lookup_group(currency, addresses):
+                nonlocal cached_count, request_count
+                missing = []
+                for address in addresses:
+                    cached = address_cache_get(currency, address)
+                    if cached:
+                        results[(currency, address)] = cached[0]
+                        cached_count += 1
+                    else:
+                        missing.append(address)
+                by_api = {}
+                for address in missing:
+                    by_api.setdefault(routes[(currency, address)]["api"], []).append(address)
+                for api, api_addresses in by_api.items():
+                    if api is None:
+                        # No multi-address endpoint handles these, so look them up one by one
+                        fetched, requests = await fetch_singly(session, currency, api_addresses, routes)
+                    else:
+                        fetched, requests = await fetch_batch(session, currency, api, api_addresses)
+                    request_count += requests
+                    for address, data in fetched.items():
+                        address_cache_put(currency, address, data)
+                        results[(currency, address)] = data
+            
+            await with_deadline(
+                asyncio.gather(*(lookup_group(currency, addresses) for currency, addresses in groups.items())),
+                ADDRESS_DEADLINE_SECONDS * 2,
+                "Batch lookup"
+            )
+            
+            # The snapshot covers every coin, so one rate lookup warms them all
+            await asyncio.wait({price_task}, timeout=PRICE_GRACE_SECONDS)
+            if not price_task.done():
+                price_task.cancel()
+            
+            content = f"**Batch Lookup:** {len(results)}/{address_count} address(es) found • {request_count} request(s) • {cached_count} from cache"
+            groups_left = len(groups)
+            for currency, addresses in groups.items():
+                currency_results = {address: results[(currency, address)] for address in addresses if (currency, address) in results}
+                section = format_batch_table(currency, addresses, currency_results, price_snapshot["rates"].get(currency))
+                if len(content) + len(section) > 3800:
+                    content += f"\n\n... {groups_left} more currency group(s) not shown"
+                    break
+                content += "\n\n" + section
+                groups_left -= 1
+            
+            if invalid:
+                skipped = ", ".join(f"`{token[:20]}`" for token in invalid[:5])
+                content += f"\n\n⚠️ **Skipped {len(invalid)} invalid token(s):** {skipped}{' ...' if len(invalid) > 5 else ''}"
+            
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content=content,
+                title="Crypto Address Info"
+            )
+            
+            updateConfigData("private", current_private)
+            await msg.delete()
+            
+        except Exception as e:
+            print(f"Error in cryptoinfo batch: {str(e)}", type_="ERROR")
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content=f"❌ **Error occurred: {str(e)}**",
+                title="Crypto Address Info"
+            )
+            updateConfigData("private", current_private)
+            await msg.delete()
+
+
+    tx_browsers = {}  # channel id -> open txs listing
+
+    async def fetch_tx_page(session, browser):
+        """Pull the next provider page into the browser's buffer; only compact entries are kept"""
+        fetch = PROVIDERS[browser["provider"]]["txs"]
+        label = f"{browser['currency'].upper()} transactions from {PROVIDERS[browser['provider']]['label']}"
+        try:
+            page = await with_deadline(
+                fetch(session, browser["currency"], browser["address"], browser["cursor"]),
+                ADDRESS_DEADLINE_SECONDS,
+                label
+            )
+        except Exception as e:
+            print(f"Error fetching {label}: {str(e)}", type_="ERROR")
+            return False
+        if page is None:
+            return False
+        items, cursor, n_tx = page
+        browser["buffer"].extend(items)
+        browser["cursor"] = cursor
+        browser["exhausted"] = cursor is None
+        if n_tx is not None:
+            browser["n_tx"] = n_tx
+        return True
 
+    async def prefetch_tx_page(session, browser):
+        request_priority.set(PRIORITY_BATCH)
+        await fetch_tx_page(session, browser)
+
+    async def fill_tx_browser(session, browser):
+        """Top the buffer up to a full embed page, picking up a running prefetch first"""
+        while len(browser["buffer"]) < TX_PAGE_SIZE and not browser["exhausted"]:
+            prefetch = browser["prefetch"]
+            browser["prefetch"] = None
+            if prefetch is not None:
+                await prefetch
+                if len(browser["buffer"]) >= TX_PAGE_SIZE or browser["exhausted"]:
+                    break
+            if not await fetch_tx_page(session, browser):
+                return False
+        return True
+
+    async def open_tx_browser(session, currency, validated):
+        """Start a listing with the first provider that can serve the address's transactions"""
+        for name in order_providers(currency, validated["providers"]):
+            if "txs" not in PROVIDERS[name]:
+                continue
+            browser = {
+                "currency": currency,
+                "address": validated["address"],
+                "type": validated["type"],
+                "provider": name,
+                "cursor": None,
+                "buffer": deque(),
+                "exhausted": False,
+                "shown": 0,
+                "page": 0,
+                "n_tx": None,
+                "prefetch": None,
+                "updated": time.monotonic()
+            }
+            if await fill_tx_browser(session, browser):
+                return browser
+        return None
+
+    def format_tx_page(browser, items):
+        """Embed body for one page of a txs listing"""
+        currency = browser["currency"]
+        symbol = currency.upper()
+        precision = 6 if currency == "eth" else 8
+        divisor = SUPPORTED_CURRENCIES[currency]["divisor"]
+        first = browser["shown"] - len(items) + 1
+        total = f" of {browser['n_tx']}" if browser["n_tx"] is not None else ""
+        
+        lines = []
+        for tx in items:
+            value = f" {tx['value'] / divisor:+.{precision}f} {symbol}" if tx.get("value") is not None else ""
+            when = f" • {format_age(time.time() - tx['time'])}" if tx.get("time") else ""
+            lines.append(f"• `{shorten_address(tx['hash'] or '?')}`{value}{when}")
+        
+        content = f"""**Address:** `{browser['address']}` ({browser['type']})
+**Page {browser['page']}:** transactions {first}–{browser['shown']}{total}
+**Source:** {PROVIDERS[browser['provider']]['label']}
+
+""" + ("\n".join(lines) if lines else "• None")
+        if browser["exhausted"] and not browser["buffer"]:
+            content += "\n\n✅ End of transaction history"
+        else:
+            content += "\n\n➡️ `<p>cryptoinfo next` for the next page"
+        return content
+
+    async def show_transactions(ctx, currency=None, validated=None):
+        """Send the next page of the channel's txs listing, opening a new one when an address is given"""
+        channel_id = ctx.channel.id
+        browser = tx_browsers.get(channel_id)
+        if validated is None:
+            if browser is None or time.monotonic() - browser["updated"] > TX_BROWSER_TTL:
+                tx_browsers.pop(channel_id, None)
+                await forwardEmbedMethod(
+                    channel_id=channel_id,
+                    content="❌ **No open transaction listing in this channel.**\n\nStart one with `<p>cryptoinfo <currency> <address> txs`.",
+                    title="Crypto Address Info"
+                )
+                return
+            currency = browser["currency"]
+        
+        print(f"Listing {currency.upper()} transactions, page {browser['page'] + 1 if validated is None else 1}", type_="INFO")
+        
+        msg = await ctx.send(f"Getting {SUPPORTED_CURRENCIES[currency]['name']} transactions, please wait...")
+        
+        current_private = getConfigData().get("private")
+        updateConfigData("private", False)
+        
+        try:
+            session = get_session()
+            if validated is not None:
+                if browser is not None and browser["prefetch"] is not None:
+                    browser["prefetch"].cancel()
+                tx_browsers.pop(channel_id, None)
+                browser = await open_tx_browser(session, currency, validated)
+                ok = browser is not None
+            else:
+                ok = await fill_tx_browser(session, browser)
+            
+            if not ok:
+                await forwardEmbedMethod(
+                    channel_id=channel_id,
+                    content=f"❌ **Failed to fetch {currency.upper()} transactions.**\n\nThe providers may be temporarily unavailable; try again in a moment.",
+                    title="Crypto Address Info"
+                )
+                updateConfigData("private", current_private)
+                await msg.delete()
+                return
+            
+            items = [browser["buffer"].popleft() for _ in range(min(TX_PAGE_SIZE, len(browser["buffer"])))]
+            browser["page"] += 1
+            browser["shown"] += len(items)
+            browser["updated"] = time.monotonic()
+            
+            if browser["exhausted"] and not browser["buffer"]:
+                tx_browsers.pop(channel_id, None)
+            else:
+                tx_browsers[channel_id] = browser
+                # Fetch the following page while this one is being read
+                if len(browser["buffer"]) < TX_PAGE_SIZE and not browser["exhausted"]:
+                    browser["prefetch"] = asyncio.create_task(prefetch_tx_page(session, browser))
+            
+            await forwardEmbedMethod(
+                channel_id=channel_id,
+                content=format_tx_page(browser, items),
+                title="Crypto Address Info"
+            )
+            
+            updateConfigData("private", current_private)
+            await msg.delete()
+            
+        except Exception as e:
+            print(f"Error in cryptoinfo txs: {str(e)}", type_="ERROR")
+            await forwardEmbedMethod(
+                channel_id=channel_id,
+                content=f"❌ **Error occurred: {str(e)}**",
+                title="Crypto Address Info"
+            )
+            updateConfigData("private", current_private)
+            await msg.delete()
 
 
     @bot.command(name="cryptoinfo", usage="<currency> <address>", description="Fetches crypto address info")
@@ -165,6 +1623,73 @@ def CryptoScript():
         await ctx.message.delete()
         
         parts = args.strip().split()
+        if parts and parts[0].lower() == "cache":
+            if len(parts) > 1 and parts[1].lower() == "clear":
+                address_cache_clear()
+                content = "🧹 **Address cache cleared.**"
+            else:
+                lookups = address_cache_stats["hits"] + address_cache_stats["misses"]
+                hit_rate = f"{address_cache_stats['hits'] / lookups:.0%}" if lookups else "n/a"
+                stored = "disabled"
+                if address_cache_db is not None:
+                    stored = f"{address_cache_db.execute('SELECT COUNT(*) FROM address_cache').fetchone()[0]} address(es)"
+                content = f"""**Cached addresses:** {len(address_cache)} / {ADDRESS_CACHE_SIZE} in memory
+**On disk:** {stored}
+**Hits:** {address_cache_stats['hits']} • **Misses:** {address_cache_stats['misses']} • **Hit rate:** {hit_rate}
+**Entry lifetime:** {ADDRESS_CACHE_TTL // 60} minute(s)"""
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content=content,
+                title="Crypto Address Info"
+            )
+            return
+        
+        if parts and parts[0].lower() == "providers":
+            now = time.monotonic()
+            lines = []
+            for name, provider in PROVIDERS.items():
+                health = get_provider_health(name)
+                coins = ", ".join(currency.upper() for currency, config in SUPPORTED_CURRENCIES.items() if name in config["providers"])
+                if health["cooldown_until"] > now:
+                    status = f"🔴 benched {int(health['cooldown_until'] - now)}s"
+                elif health["consecutive_failures"]:
+                    status = "🟡 failing"
+                else:
+                    status = "🟢 ok"
+                latency = "no samples"
+                if health["latencies"]:
+                    latency = f"p50 {provider_latency(name, 0.5) * 1000:.0f} ms • p95 {provider_latency(name, 0.95) * 1000:.0f} ms"
+                lines.append(f"**{provider['label']}** ({coins}): {status} • {latency} • {health['successes']} ok / {health['failures']} failed")
+            if endpoint_stats:
+                lines.append("\n**Payloads (avg per request):**")
+                for name in PROVIDERS:
+                    summary = format_endpoint_average(name, False)
+                    detailed = format_endpoint_average(name, True)
+                    if summary or detailed:
+                        lines.append(f"`{PROVIDERS[name]['label']}`: balance {summary or 'n/a'} • details {detailed or 'n/a'}")
+            if rate_limiters:
+                lines.append("\n**Rate limits:**")
+                for host, limiter in sorted(rate_limiters.items()):
+                    paused = f" • paused {limiter['blocked_until'] - now:.1f}s" if limiter["blocked_until"] > now else ""
+                    lines.append(
+                        f"`{host}`: {limiter['rate']:.2g}/{limiter['max_rate']:.2g} req/s • {len(limiter['queue'])} queued"
+                        f" • {limiter['requests']} sent • {limiter['throttled']}× 429{paused}"
+                    )
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content="\n".join(lines),
+                title="Crypto Address Info"
+            )
+            return
+        
+        if parts and parts[0].lower() == "batch":
+            await batch_lookup(ctx, parts[1:])
+            return
+        
+        if parts and parts[0].lower() == "next":
+            await show_transactions(ctx)
+            return
+        
         if len(parts) < 2:
             supported_list = ", ".join(SUPPORTED_CURRENCIES.keys()).upper()
             await forwardEmbedMethod(
@@ -174,6 +1699,11 @@ def CryptoScript():
             )
             return
         
+        details = len(parts) > 2 and parts[-1].lower() == "details"
+        txs = len(parts) > 2 and parts[-1].lower() == "txs"
+        if details or txs:
+            parts = parts[:-1]
+        
         currency = parts[0].lower()
         address = " ".join(parts[1:])
         
@@ -186,15 +1716,20 @@ def CryptoScript():
             )
             return
         
-        min_length = 20
-        
-        if len(address) < min_length:
+        try:
+            validated = validate_address(currency, address)
+        except ValueError as e:
             await forwardEmbedMethod(
                 channel_id=ctx.channel.id,
-                content="❌ **Invalid address format.** Please provide a valid cryptocurrency address.",
+                content=f"❌ **Invalid {SUPPORTED_CURRENCIES[currency]['name']} address:** {e}\n\nPlease check the address and try again.",
                 title="Crypto Address Info"
             )
             return
+        address = validated["address"]
+        
+        if txs:
+            await show_transactions(ctx, currency, validated)
+            return
         
         print(f"Looking up {currency.upper()} address: '{address}'", type_="INFO")
         
@@ -204,84 +1739,133 @@ def CryptoScript():
         updateConfigData("private", False)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                currency_config = SUPPORTED_CURRENCIES[currency]
-                
-                if currency == "btc":
-                    address_data = await get_bitcoin_info(session, address)
+            session = get_session()
+            currency_config = SUPPORTED_CURRENCIES[currency]
+            
+            # The EUR rate doesn't depend on the address, so request it alongside the address data
+            price_task = asyncio.create_task(with_deadline(
+                get_eur_conversion_rate(session, currency),
+                PRICE_DEADLINE_SECONDS,
+                f"EUR rate for {currency.upper()}"
+            ))
+            
+            data_age = None
+            provider = None
+            # Details need the transaction payload, which the cache doesn't keep
+            cached = None if details else address_cache_get(currency, address)
+            if cached:
+                address_data, data_age = cached
+            else:
+                looked_up = await with_deadline(
+                    lookup_address(session, currency, address, details, validated["providers"]),
+                    ADDRESS_DEADLINE_SECONDS,
+                    f"{currency.upper()} address lookup"
+                )
+                address_data, provider = looked_up or (None, None)
+                if address_data:
+                    address_cache_put(currency, address, {key: value for key, value in address_data.items() if key != "recent_txs"})
                 else:
-                    address_data = await get_blockcypher_info(session, currency, address)
-                
-                if not address_data:
-                    await forwardEmbedMethod(
-                        channel_id=ctx.channel.id,
-                        content=f"❌ **Failed to fetch information for {currency.upper()} address.**\n\nThis could mean:\n• The address doesn't exist\n• The address format is invalid\n• The API is temporarily unavailable.",
-                        title="Crypto Address Info"
-                    )
-                    await msg.delete()
-                    updateConfigData("private", current_private)
-                    return
-                
+                    stale = address_cache_get(currency, address, allow_stale=True)
+                    if stale:
+                        print(f"Providers unavailable, serving cached {currency.upper()} data", type_="WARNING")
+                        address_data, data_age = stale
+            
+            if not address_data:
+                price_task.cancel()
+                await forwardEmbedMethod(
+                    channel_id=ctx.channel.id,
+                    content=f"❌ **Failed to fetch information for {currency.upper()} address.**\n\nThis could mean:\n• The address doesn't exist\n• The address format is invalid\n• The API is temporarily unavailable.",
+                    title="Crypto Address Info"
+                )
+                await msg.delete()
+                updateConfigData("private", current_private)
+                return
+            
 
+            
+            currency_name = SUPPORTED_CURRENCIES[currency]['name']
+            
+            if currency in ["btc", "ltc", "bch", "doge", "dash", "zec", "bts"]:
+                precision = 8
+            elif currency == "eth":
+                precision = 6
+            else:
+                precision = 8
+            
+            balance = f"{address_data['balance']:.{precision}f}"
+            total_received = f"{address_data['total_received']:.{precision}f}"
+            total_sent = f"{address_data['total_sent']:.{precision}f}"
+            
+            eur_rate = None
+            rate_age = None
+            try:
+                price = await asyncio.wait_for(asyncio.shield(price_task), timeout=PRICE_GRACE_SECONDS)
+                if price:
+                    eur_rate, rate_age = price
+            except asyncio.TimeoutError:
+                price_task.cancel()
+                print(f"EUR rate for {currency.upper()} still pending, sending without it", type_="WARNING")
+            
+            balance_eur = ""
+            total_received_eur = ""
+            total_sent_eur = ""
+            
+            if eur_rate:
+                if address_data['balance'] > 0:
+                    balance_eur_value = address_data['balance'] * eur_rate
+                    balance_eur = f" (≈ €{balance_eur_value:,.2f})"
                 
-                currency_name = SUPPORTED_CURRENCIES[currency]['name']
-                
-                if currency in ["btc", "ltc", "bch", "doge", "dash", "zec", "bts"]:
-                    precision = 8
-                elif currency == "eth":
-                    precision = 6
-                else:
-                    precision = 8
-                
-                balance = f"{address_data['balance']:.{precision}f}"
-                total_received = f"{address_data['total_received']:.{precision}f}"
-                total_sent = f"{address_data['total_sent']:.{precision}f}"
-                
-                eur_rate = await get_eur_conversion_rate(session, address_data['currency'])
-                
-                balance_eur = ""
-                total_received_eur = ""
-                total_sent_eur = ""
-                
-                if eur_rate:
-                    if address_data['balance'] > 0:
-                        balance_eur_value = address_data['balance'] * eur_rate
-                        balance_eur = f" (≈ €{balance_eur_value:,.2f})"
-                    
-                    if address_data['total_received'] > 0:
-                        received_eur_value = address_data['total_received'] * eur_rate
-                        total_received_eur = f" (≈ €{received_eur_value:,.2f})"
-                    
-                    if address_data['total_sent'] > 0:
-                        sent_eur_value = address_data['total_sent'] * eur_rate
-                        total_sent_eur = f" (≈ €{sent_eur_value:,.2f})"
+                if address_data['total_received'] > 0:
+                    received_eur_value = address_data['total_received'] * eur_rate
+                    total_received_eur = f" (≈ €{received_eur_value:,.2f})"
                 
-                content = f"""**Currency:** {currency_name} ({address_data['currency']})
-**Address:** `{address_data['address']}`
+                if address_data['total_sent'] > 0:
+                    sent_eur_value = address_data['total_sent'] * eur_rate
+                    total_sent_eur = f" (≈ €{sent_eur_value:,.2f})"
+            
+            content = f"""**Currency:** {currency_name} ({address_data['currency']})
+**Address:** `{address_data['address']}` ({validated['type']})
 **Current Balance:** {balance} {address_data['currency']}{balance_eur}
 **Total Received:** {total_received} {address_data['currency']}{total_received_eur}
 **Total Sent:** {total_sent} {address_data['currency']}{total_sent_eur}
 **Number of Transactions:** **{address_data['n_tx']}**"""
+            
+            if data_age is not None:
+                content += f"\n**Data Age:** cached {format_age(data_age)}"
+            elif provider:
+                content += f"\n**Source:** {PROVIDERS[provider]['label']}"
+            
+            if details and address_data.get("recent_txs") is not None:
+                tx_lines = []
+                for tx in address_data["recent_txs"]:
+                    when = f" - {format_age(time.time() - tx['time'])}" if tx.get("time") else ""
+                    tx_lines.append(f"• `{shorten_address(tx['hash'] or '?')}`{when}")
+                content += "\n\n**Recent Transactions:**\n" + ("\n".join(tx_lines) if tx_lines else "• None")
+                content += f"\n\n**Payload:** {format_endpoint_comparison(provider)}"
+            
+            if eur_rate:
+                rate_text = f"{eur_rate:,.2f}" if eur_rate >= 1 else f"{eur_rate:.6g}"
+                content += f"\n**EUR Rate:** €{rate_text} per {address_data['currency']} (updated {format_age(rate_age)})"
 
-                explorer_links = {
-                    "btc": f"https://blockstream.info/address/{address_data['address']}",
-                    "ltc": f"https://live.blockcypher.com/ltc/{address_data['address']}/",
-                    "eth": f"https://etherscan.io/address/{address_data['address']}",
-                    "bch": f"https://live.blockcypher.com/bch/{address_data['address']}/",
-                    "doge": f"https://live.blockcypher.com/doge/{address_data['address']}/",
-                    "dash": f"https://live.blockcypher.com/dash/{address_data['address']}/",
-                    "zec": f"https://live.blockcypher.com/zec/{address_data['address']}/",
-                    "bts": f"https://live.blockcypher.com/bts/{address_data['address']}/"
-                }
-                
-                if currency in explorer_links:
-                    content += f"\n\n**Blockchain Explorer:**\n• [View Address Details]({explorer_links[currency]})"
-                
-                await forwardEmbedMethod(
-                    channel_id=ctx.channel.id,
-                    content=content,
-                    title="Crypto Address Info"
-                )
+            explorer_links = {
+                "btc": f"https://blockstream.info/address/{address_data['address']}",
+                "ltc": f"https://live.blockcypher.com/ltc/{address_data['address']}/",
+                "eth": f"https://etherscan.io/address/{address_data['address']}",
+                "bch": f"https://live.blockcypher.com/bch/{address_data['address']}/",
+                "doge": f"https://live.blockcypher.com/doge/{address_data['address']}/",
+                "dash": f"https://live.blockcypher.com/dash/{address_data['address']}/",
+                "zec": f"https://live.blockcypher.com/zec/{address_data['address']}/",
+                "bts": f"https://live.blockcypher.com/bts/{address_data['address']}/"
+            }
+            
+            if currency in explorer_links:
+                content += f"\n\n**Blockchain Explorer:**\n• [View Address Details]({explorer_links[currency]})"
+            
+            await forwardEmbedMethod(
+                channel_id=ctx.channel.id,
+                content=content,
+                title="Crypto Address Info"
+            )
             
             updateConfigData("private", current_private)
             await msg.delete()
@@ -2,14 +2,14 @@ guild_data = {}
 is_loading = False
 
 @nightyScript(
-    name="Guilds Manager v1.0",
+    name="Guilds Manager v1.5",
     author="simnJS",
     description="Discord server management interface with visual guild listing and leave functionality.",
     usage="UI Script - Use the Guild Manager tab to view and leave servers"
 )
 def GuildManagerScript():
     """
-    GUILDS MANAGER SCRIPT v1.0
+    GUILDS MANAGER SCRIPT v1.5
     --------------------------
     
     Discord server management interface for viewing and leaving servers.
@@ -26,71 +26,283 @@ def GuildManagerScript():
     USAGE:
     Access the "Guilds Manager" tab in Nighty to:
     • View all servers the bot is connected to
+    • Type in the search box to filter servers by name
+    • Use "Prev" / "Next" to move between pages
     • Click "Leave" next to any server to disconnect
+    • Tick several servers and click "Leave selected" to leave them in one go
+    • Click "Refresh" to rebuild the list from scratch
     • Get instant feedback through notifications
     
     NOTES:
-    - Interface automatically refreshes after leaving servers
+    - Leaving a server updates only the affected cards; the tab is rebuilt only on Refresh
+    - Joins, kicks, renames and servers left from the client show up live, without a reload
     - Leave operations are safe and include error handling
-    - Supports any number of servers with scroll functionality
+    - Server icons load lazily for the cards on screen and are cached on disk by icon hash
+    - Leaves run from a queue on the bot's event loop, paced for Discord's rate limits; the UI never waits on them
+    - Only the current page of cards is built (GUILDS_PER_PAGE), however many servers there are
+    - Search uses a case-folded index: word prefixes for 1-2 characters, any substring from 3
     
     CHANGELOG:
+    v1.5 - Server icons
+         - Icons fetched only for visible cards, ICON_FETCH_CONCURRENCY at a time, at ICON_SIZE from the CDN
+         - In-memory LRU plus json/guild_icons/<hash>.png, so unchanged icons are never downloaded twice
+
+    v1.4 - Bulk leave
+         - Checkboxes on every card and a "Leave selected" action
+         - Leaves queued on bot.loop, LEAVE_INTERVAL_SECONDS apart, with 429 retries and progress toasts
+         - The UI thread no longer blocks on a leave request
+
+    v1.3 - Paging and search
+         - Cards built for the visible page only and rebound when the page or filter changes
+         - Search box backed by a prefix/trigram index kept up to date with joins, leaves and renames
+
+    v1.2 - Live guild sync
+         - Listens to guild join, remove and update events
+         - Bursts are debounced (GUILD_EVENT_DEBOUNCE) and applied as one incremental card update
+
+    v1.1 - Incremental updates
+         - Guild id to card mapping; a leave or join updates cards in place instead of rebuilding the Tab
+         - Cards are reused in sorted order, so at most one new card is created per join
+         - Refresh button for an explicit full rebuild
+
     v1.0 - Initial release
          - Complete guild management interface
          - Leave functionality with notifications
          - Two-column layout with server cards
     """
     import asyncio
+    import base64
+    import discord
+    import os
+    import threading
+    import time
+    from bisect import bisect_left, insort
+    from collections import OrderedDict
 
     global guild_data, is_loading
 
+    guild_order = []  # (case-folded name, guild id), sorted like the cards
+    guild_cards = {}  # guild id -> card slot currently showing it
+    card_slots = []  # every card built so far, in display order
+    ui_lock = threading.RLock()  # UI callbacks and gateway events both edit the list
+
+    GUILDS_PER_PAGE = 24  # cards built at once; other pages reuse them
+    SEARCH_GRAM_SIZE = 3  # queries at least this long match anywhere in the name
+
+    search_words = []  # sorted (case-folded word, guild id), for prefix lookups
+    search_grams = {}  # case-folded trigram -> ids of guilds whose name contains it
+    search_results = []  # guild_order entries matching the current search
+
+    LEAVE_INTERVAL_SECONDS = 1.5  # pause between leave requests
+    LEAVE_MAX_INTERVAL_SECONDS = 10  # ceiling for the pause after repeated 429s
+    LEAVE_RETRIES = 3  # attempts per guild when rate limited
+    LEAVE_PROGRESS_EVERY = 5  # toast after this many leaves in a bulk run
+
+    selected_guilds = set()  # guild ids ticked for "Leave selected"
+    leaving_guilds = set()  # guild ids queued or being left
+    leave_state = {"queue": None, "worker": None, "interval": LEAVE_INTERVAL_SECONDS, "done": 0, "failed": 0, "total": 0}
+
+    ICON_SIZE = 64  # pixels; the CDN resizes once and the result is what gets cached
+    ICON_FETCH_CONCURRENCY = 4  # icon downloads in flight at once
+    ICON_CACHE_SIZE = 256  # icons kept in memory
+    ICON_CACHE_DIR = os.path.join(getScriptsPath(), "json", "guild_icons")
+
+    icon_cache = OrderedDict()  # icon hash -> data URI, least recently used first
+    icons_loading = set()  # icon hashes being read or downloaded
+    icon_semaphore = asyncio.Semaphore(ICON_FETCH_CONCURRENCY)
+
+    GUILD_EVENT_DEBOUNCE = 0.5  # seconds of quiet before queued guild events are applied
+    GUILD_EVENT_MAX_DELAY = 3  # apply anyway once the oldest queued event is this old
+    pending_changes = {}  # guild id -> guild to (re)insert, or None to remove
+
     def debug_log(message):
         print(f"[Guild Manager Debug] {message}")
 
     def log_message(message, level="INFO"):
         print(f"[{level}] {message}")
 
-    def leave_guild_sync(guild_id):
-        """Leave a guild synchronously"""
-        try:
-            guild = bot.get_guild(int(guild_id))
-            if not guild:
-                return False, "Guild not found"
-            name = guild.name
-            future = asyncio.run_coroutine_threadsafe(guild.leave(), bot.loop)
-            future.result(timeout=10)
-            guild_data.pop(guild_id, None)
-            return True, name
-        except Exception as e:
-            return False, str(e)
+    async def leave_guild(guild_id):
+        """Leave one guild, retrying when Discord rate limits the request"""
+        guild = bot.get_guild(int(guild_id))
+        if not guild:
+            return False, "Guild not found"
+        for attempt in range(1, LEAVE_RETRIES + 1):
+            try:
+                await guild.leave()
+                return True, guild.name
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == LEAVE_RETRIES:
+                    return False, str(e)
+                retry_after = getattr(e, "retry_after", None) or leave_state["interval"] * attempt
+                # Slow the whole queue down, not just this guild
+                leave_state["interval"] = min(leave_state["interval"] * 2, LEAVE_MAX_INTERVAL_SECONDS)
+                log_message(f"Rate limited leaving {guild.name}, retrying in {retry_after:.1f}s", "WARNING")
+                await asyncio.sleep(retry_after)
+            except Exception as e:
+                return False, str(e)
+
+    async def leave_worker():
+        """Drain the leave queue one guild at a time, paced and reporting progress"""
+        queue = leave_state["queue"]
+        while not queue.empty():
+            guild_id = await queue.get()
+            success, result = await leave_guild(guild_id)
+            with ui_lock:
+                leaving_guilds.discard(guild_id)
+                selected_guilds.discard(guild_id)
+            if success:
+                leave_state["done"] += 1
+                remove_guild(guild_id)
+            else:
+                leave_state["failed"] += 1
+                refresh_card(guild_id)
+                gm_tab.toast(
+                    title="Error",
+                    description=f"Failed to leave {guild_data.get(guild_id, {}).get('name', guild_id)}: {result}",
+                    type="ERROR"
+                )
+            
+            finished = leave_state["done"] + leave_state["failed"]
+            if leave_state["total"] == 1 and success:
+                gm_tab.toast(
+                    title="Left Server",
+                    description=f"You have left {result}",
+                    type="SUCCESS"
+                )
+            elif leave_state["total"] > 1 and (finished % LEAVE_PROGRESS_EVERY == 0 or queue.empty()):
+                gm_tab.toast(
+                    title="Leaving Servers" if not queue.empty() else "Bulk Leave Finished",
+                    description=f"{leave_state['done']}/{leave_state['total']} left, {leave_state['failed']} failed",
+                    type="INFO" if not queue.empty() else "SUCCESS"
+                )
+            
+            if not queue.empty():
+                await asyncio.sleep(leave_state["interval"])
+            elif leave_state["interval"] > LEAVE_INTERVAL_SECONDS:
+                # Recover gradually once the queue drains
+                leave_state["interval"] = max(LEAVE_INTERVAL_SECONDS, leave_state["interval"] / 2)
+        leave_state["worker"] = None
+        leave_state.update(done=0, failed=0, total=0)
+
+    def enqueue_leaves(guild_ids):
+        """Queue guilds to leave; runs on bot.loop"""
+        if leave_state["queue"] is None:
+            leave_state["queue"] = asyncio.Queue()
+        for guild_id in guild_ids:
+            leave_state["queue"].put_nowait(guild_id)
+        leave_state["total"] += len(guild_ids)
+        if leave_state["worker"] is None:
+            leave_state["worker"] = asyncio.ensure_future(leave_worker())
+
+    def queue_leaves(guild_ids):
+        """Hand guilds to the leave queue without waiting on any request"""
+        with ui_lock:
+            guild_ids = [guild_id for guild_id in guild_ids if guild_id in guild_data and guild_id not in leaving_guilds]
+            leaving_guilds.update(guild_ids)
+            for guild_id in guild_ids:
+                refresh_card(guild_id)
+            update_selection()
+        if guild_ids:
+            bot.loop.call_soon_threadsafe(enqueue_leaves, guild_ids)
+        return len(guild_ids)
 
     def leave_guild_handler(guild_id):
         """Handler to leave a specific guild"""
-        success, result = leave_guild_sync(guild_id)
-        if success:
-            gm_tab.toast(
-                title="Left Server",
-                description=f"You have left {result}",
-                type="SUCCESS"
-            )
-            load_guild_data()
-        else:
+        queue_leaves([guild_id])
+
+    def leave_selected_handler():
+        """Queue every ticked guild for leaving"""
+        count = queue_leaves(sorted(selected_guilds))
+        if count:
             gm_tab.toast(
-                title="Error",
-                description=f"Failed to leave server: {result}",
-                type="ERROR"
+                title="Leaving Servers",
+                description=f"Queued {count} server(s), about {count * leave_state['interval']:.0f}s",
+                type="INFO"
             )
 
-    def make_leave_handler(guild_id):
-        """Create a unique handler with __name__ defined"""
+    def make_select_handler(slot):
+        """Checkbox handler that ticks or unticks whichever guild the card shows"""
+        def handler(checked):
+            with ui_lock:
+                if slot["guild_id"] is None:
+                    return
+                if checked:
+                    selected_guilds.add(slot["guild_id"])
+                else:
+                    selected_guilds.discard(slot["guild_id"])
+                update_selection()
+        handler.__name__ = f"select_handler_{slot['index']}"
+        return handler
+
+    def update_selection():
+        # Ticked guilds that were left or kicked elsewhere no longer count
+        selected_guilds.intersection_update(guild_data)
+        if leave_selected_button is not None:
+            pending = len(selected_guilds - leaving_guilds)
+            leave_selected_button.label = f"Leave selected ({pending})" if pending else "Leave selected"
+            leave_selected_button.disabled = not pending
+
+    def icon_cache_get(icon_hash):
+        uri = icon_cache.get(icon_hash)
+        if uri is not None:
+            icon_cache.move_to_end(icon_hash)
+        return uri
+
+    def icon_cache_put(icon_hash, data):
+        icon_cache[icon_hash] = "data:image/png;base64," + base64.b64encode(data).decode()
+        icon_cache.move_to_end(icon_hash)
+        while len(icon_cache) > ICON_CACHE_SIZE:
+            icon_cache.popitem(last=False)
+
+    def read_icon_file(path):
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write_icon_file(path, data):
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    async def load_icon(guild_id, icon_hash):
+        """Load an icon from disk or the CDN and show it on the cards that use it"""
+        try:
+            path = os.path.join(ICON_CACHE_DIR, f"{icon_hash}.png")
+            data = await bot.loop.run_in_executor(None, read_icon_file, path)
+            if data is None:
+                async with icon_semaphore:
+                    # The card may have scrolled away while this waited for a slot
+                    guild = bot.get_guild(guild_id)
+                    if guild_id not in guild_cards or guild is None or guild.icon is None or guild.icon.key != icon_hash:
+                        return
+                    data = await guild.icon.replace(size=ICON_SIZE, format="png").read()
+                await bot.loop.run_in_executor(None, write_icon_file, path, data)
+            with ui_lock:
+                icon_cache_put(icon_hash, data)
+                for shown_id, slot in list(guild_cards.items()):
+                    if guild_data.get(shown_id, {}).get("icon") == icon_hash:
+                        bind_card(slot, shown_id)
+        except Exception as e:
+            debug_log(f"Failed to load icon {icon_hash}: {e}")
+        finally:
+            icons_loading.discard(icon_hash)
+
+    def start_icon_load(guild_id, icon_hash):
+        asyncio.ensure_future(load_icon(guild_id, icon_hash))
+
+    def make_leave_handler(slot):
+        """Create a unique handler with __name__ defined; it leaves whichever guild the card shows"""
         def handler():
-            leave_guild_handler(guild_id)
-        handler.__name__ = f"leave_handler_{guild_id}"
+            if slot["guild_id"] is not None:
+                leave_guild_handler(slot["guild_id"])
+        handler.__name__ = f"leave_handler_{slot['index']}"
         return handler
 
     def initialize_ui():
         """Initialize or reset the Tab and main container"""
-        nonlocal gm_tab, main_container
+        nonlocal gm_tab, main_container, summary_text, prev_button, next_button, leave_selected_button
         gm_tab = Tab(name="Guilds Manager", icon="preferences", title="Guilds Manager")
         main_container = gm_tab.create_container(
             type="rows",
@@ -100,55 +312,322 @@ def GuildManagerScript():
             vertical_align="start",
             overflow="auto"
         )
+        toolbar = main_container.create_group(
+            type="columns",
+            gap=2,
+            vertical_align="center"
+        )
+        summary_text = toolbar.create_ui_element(
+            UI.Text,
+            content="",
+            full_width=True
+        )
+        toolbar.create_ui_element(
+            UI.Input,
+            label="Search",
+            placeholder="Server name",
+            onInput=search_handler
+        )
+        prev_button = toolbar.create_ui_element(
+            UI.Button,
+            label="Prev",
+            variant="bordered",
+            onClick=prev_page_handler
+        )
+        next_button = toolbar.create_ui_element(
+            UI.Button,
+            label="Next",
+            variant="bordered",
+            onClick=next_page_handler
+        )
+        leave_selected_button = toolbar.create_ui_element(
+            UI.Button,
+            label="Leave selected",
+            variant="solid",
+            color="danger",
+            disabled=True,
+            onClick=leave_selected_handler
+        )
+        toolbar.create_ui_element(
+            UI.Button,
+            label="Refresh",
+            variant="bordered",
+            onClick=load_guild_data
+        )
+
+    def create_card_slot():
+        """Append one reusable card to the grid, two per row"""
+        index = len(card_slots)
+        if index % 2 == 0:
+            row_containers.append(main_container.create_container(
+                type="columns",
+                gap=4,
+                horizontal_align="start",
+                vertical_align="start"
+            ))
+        slot = {"index": index, "guild_id": None}
+        slot["card"] = row_containers[-1].create_card(gap=4)
+        header_group = slot["card"].create_group(
+            type="columns",
+            gap=2,
+            vertical_align="center"
+        )
+        slot["checkbox"] = header_group.create_ui_element(
+            UI.Checkbox,
+            checked=False,
+            onChange=make_select_handler(slot)
+        )
+        slot["image"] = header_group.create_ui_element(
+            UI.Image,
+            url="",
+            width=32,
+            height=32,
+            visible=False
+        )
+        slot["text"] = header_group.create_ui_element(
+            UI.Text,
+            content="",
+            size="lg",
+            full_width=True
+        )
+        slot["button"] = header_group.create_ui_element(
+            UI.Button,
+            label="Leave",
+            variant="solid",
+            color="danger",
+            onClick=make_leave_handler(slot)
+        )
+        card_slots.append(slot)
+        return slot
+
+    def bind_card(slot, guild_id):
+        """Point a card at a guild, or hide it when there is none"""
+        if slot["guild_id"] not in (None, guild_id) and guild_cards.get(slot["guild_id"]) is slot:
+            del guild_cards[slot["guild_id"]]
+        slot["guild_id"] = guild_id
+        if guild_id is None:
+            slot["card"].visible = False
+            return
+        guild_cards[guild_id] = slot
+        content = f"🏛️ {guild_data[guild_id]['name']}"
+        if slot["text"].content != content:
+            slot["text"].content = content
+        icon_hash = guild_data[guild_id]["icon"]
+        uri = icon_cache_get(icon_hash) if icon_hash else None
+        if uri is not None:
+            if slot["image"].url != uri:
+                slot["image"].url = uri
+        elif icon_hash and icon_hash not in icons_loading:
+            icons_loading.add(icon_hash)
+            bot.loop.call_soon_threadsafe(start_icon_load, guild_id, icon_hash)
+        slot["image"].visible = uri is not None
+        slot["checkbox"].checked = guild_id in selected_guilds
+        slot["button"].disabled = guild_id in leaving_guilds
+        slot["button"].label = "Leaving..." if guild_id in leaving_guilds else "Leave"
+        slot["card"].visible = True
+
+    def refresh_card(guild_id):
+        """Redraw a guild's card if it is on the current page"""
+        slot = guild_cards.get(guild_id)
+        if slot is not None:
+            bind_card(slot, guild_id)
+
+    def index_guild(guild_id, folded):
+        for word in set(folded.split()) | {folded}:
+            insort(search_words, (word, guild_id))
+        for gram in {folded[i:i + SEARCH_GRAM_SIZE] for i in range(len(folded) - SEARCH_GRAM_SIZE + 1)}:
+            search_grams.setdefault(gram, set()).add(guild_id)
+
+    def unindex_guild(guild_id, folded):
+        for word in set(folded.split()) | {folded}:
+            position = bisect_left(search_words, (word, guild_id))
+            if position < len(search_words) and search_words[position] == (word, guild_id):
+                del search_words[position]
+        for gram in {folded[i:i + SEARCH_GRAM_SIZE] for i in range(len(folded) - SEARCH_GRAM_SIZE + 1)}:
+            ids = search_grams.get(gram)
+            if ids is not None:
+                ids.discard(guild_id)
+                if not ids:
+                    del search_grams[gram]
+
+    def search_guilds(query):
+        """guild_order entries whose name matches the query, in display order"""
+        folded = query.casefold().strip()
+        if len(folded) >= SEARCH_GRAM_SIZE:
+            grams = sorted(
+                (search_grams.get(folded[i:i + SEARCH_GRAM_SIZE], set()) for i in range(len(folded) - SEARCH_GRAM_SIZE + 1)),
+                key=len
+            )
+            # Trigrams narrow the candidates; the substring check rules out false positives
+            candidates = set(grams[0]).intersection(*grams[1:])
+            matches = [guild_id for guild_id in candidates if folded in guild_data[guild_id]["folded"]]
+        else:
+            matches = set()
+            position = bisect_left(search_words, (folded,))
+            while position < len(search_words) and search_words[position][0].startswith(folded):
+                matches.add(search_words[position][1])
+                position += 1
+        return sorted((guild_data[guild_id]["name"].lower(), guild_id) for guild_id in matches)
+
+    def update_cards(start=0):
+        """Rebind the current page's cards from a sorted position onwards after an insert or removal"""
+        nonlocal current_page
+        if search_query:
+            # Positions in guild_order don't map onto the filtered view, so redo the page
+            search_results[:] = search_guilds(search_query)
+            start = 0
+        view = search_results if search_query else guild_order
+        page_count = max(1, -(-len(view) // GUILDS_PER_PAGE))
+        shown_page = current_page
+        current_page = min(current_page, page_count - 1)
+        first = current_page * GUILDS_PER_PAGE
+        if current_page != shown_page:
+            # The last page emptied out; the page before it has to be drawn in full
+            start = 0
+        page = view[first:first + GUILDS_PER_PAGE]
+        
+        while len(card_slots) < len(page):
+            create_card_slot()
+        for position in range(max(start, first) - first, len(card_slots)):
+            bind_card(card_slots[position], page[position][1] if position < len(page) else None)
+        
+        if summary_text is not None:
+            matched = f" • {len(view)} match(es)" if search_query else ""
+            summary_text.content = f"{len(guild_order)} server(s){matched} • page {current_page + 1}/{page_count}"
+        if prev_button is not None:
+            prev_button.disabled = current_page == 0
+            next_button.disabled = current_page >= page_count - 1
+
+    def search_handler(value):
+        """Filter the list as the search box changes"""
+        nonlocal search_query, current_page
+        with ui_lock:
+            search_query = (value or "").strip()
+            current_page = 0
+            update_cards()
+
+    def prev_page_handler():
+        nonlocal current_page
+        with ui_lock:
+            if current_page > 0:
+                current_page -= 1
+                update_cards()
+
+    def next_page_handler():
+        nonlocal current_page
+        with ui_lock:
+            current_page += 1
+            update_cards()
+
+    def add_guild_entry(guild):
+        """Add a guild to the sorted list and return its position"""
+        guild_data[guild.id] = {
+            "name": guild.name,
+            "folded": guild.name.casefold(),
+            "icon": guild.icon.key if guild.icon else None,
+            "guild_object": guild
+        }
+        index_guild(guild.id, guild_data[guild.id]["folded"])
+        position = bisect_left(guild_order, (guild.name.lower(), guild.id))
+        guild_order.insert(position, (guild.name.lower(), guild.id))
+        return position
+
+    def drop_guild_entry(guild_id):
+        """Remove a guild from the sorted list and return where it was, or None"""
+        entry = guild_data.pop(guild_id, None)
+        if entry is None:
+            return None
+        unindex_guild(guild_id, entry["folded"])
+        position = bisect_left(guild_order, (entry["name"].lower(), guild_id))
+        del guild_order[position]
+        return position
+
+    def remove_guild(guild_id):
+        """Drop one guild from the list, shifting only the cards after it"""
+        with ui_lock:
+            position = drop_guild_entry(guild_id)
+            if position is not None:
+                update_cards(position)
+
+    def flush_guild_changes():
+        """Apply every queued guild event with a single pass over the cards"""
+        nonlocal flush_handle
+        flush_handle = None
+        if is_loading or gm_tab is None:
+            flush_handle = bot.loop.call_later(GUILD_EVENT_DEBOUNCE, flush_guild_changes)
+            return
+        changes = dict(pending_changes)
+        pending_changes.clear()
+        with ui_lock:
+            # Each edit only moves cards at or after its own position
+            start = len(guild_order)
+            for guild_id, guild in changes.items():
+                position = drop_guild_entry(guild_id)
+                if position is not None:
+                    start = min(start, position)
+                if guild is not None:
+                    start = min(start, add_guild_entry(guild))
+            update_cards(start)
+            update_selection()
+
+    def queue_guild_change(guild_id, guild):
+        """Record a guild event and (re)arm the debounce timer"""
+        nonlocal flush_handle, first_pending
+        if not pending_changes:
+            first_pending = time.monotonic()
+        pending_changes[guild_id] = guild
+        if flush_handle is not None:
+            flush_handle.cancel()
+        delay = min(GUILD_EVENT_DEBOUNCE, max(0, first_pending + GUILD_EVENT_MAX_DELAY - time.monotonic()))
+        flush_handle = bot.loop.call_later(delay, flush_guild_changes)
+
+    @bot.listen("on_guild_join")
+    async def guild_manager_on_join(guild):
+        queue_guild_change(guild.id, guild)
+
+    @bot.listen("on_guild_remove")
+    async def guild_manager_on_remove(guild):
+        queue_guild_change(guild.id, None)
+
+    @bot.listen("on_guild_update")
+    async def guild_manager_on_update(before, after):
+        if before.name != after.name or before.icon != after.icon:
+            queue_guild_change(after.id, after)
 
     def load_guild_data():
-        """Load guild data and create cards in pairs"""
+        """Full rebuild: new Tab, guilds re-read from the client and the first page of cards created"""
         global guild_data, is_loading
+        nonlocal search_query, current_page
         if is_loading:
             return
         is_loading = True
-        guild_data.clear()
 
         try:
-            initialize_ui()
-
-            guilds = sorted(bot.guilds, key=lambda g: g.name.lower())
-            for i in range(0, len(guilds), 2):
-                pair = guilds[i:i+2]
-                row_container = main_container.create_container(
-                    type="columns",
-                    gap=4,
-                    horizontal_align="start",
-                    vertical_align="start"
-                )
-                for guild in pair:
-                    current_guild_id = guild.id
-                    current_guild_name = guild.name
-                    guild_data[current_guild_id] = {
-                        "name": current_guild_name,
+            with ui_lock:
+                pending_changes.clear()
+                guild_data.clear()
+                guild_order.clear()
+                guild_cards.clear()
+                card_slots.clear()
+                row_containers.clear()
+                search_words.clear()
+                search_grams.clear()
+                search_query = ""
+                current_page = 0
+                initialize_ui()
+
+                for guild in bot.guilds:
+                    guild_data[guild.id] = {
+                        "name": guild.name,
+                        "folded": guild.name.casefold(),
+                        "icon": guild.icon.key if guild.icon else None,
                         "guild_object": guild
                     }
-
-                    guild_card = row_container.create_card(gap=4)
-
-                    header_group = guild_card.create_group(
-                        type="columns",
-                        gap=2,
-                        vertical_align="center"
-                    )
-                    header_group.create_ui_element(
-                        UI.Text,
-                        content=f"🏛️ {current_guild_name}",
-                        size="lg",
-                        full_width=True
-                    )
-                    header_group.create_ui_element(
-                        UI.Button,
-                        label="Leave",
-                        variant="solid",
-                        color="danger",
-                        onClick=make_leave_handler(current_guild_id)
-                    )
+                    guild_order.append((guild.name.lower(), guild.id))
+                    index_guild(guild.id, guild_data[guild.id]["folded"])
+                guild_order.sort()
+                update_cards()
+                update_selection()
 
         except Exception as e:
             log_message(f"Error loading guilds: {e}", "ERROR")
@@ -159,6 +638,15 @@ def GuildManagerScript():
     try:
         main_container = None
         gm_tab = None
+        summary_text = None
+        prev_button = None
+        next_button = None
+        leave_selected_button = None
+        row_containers = []
+        search_query = ""
+        current_page = 0
+        flush_handle = None
+        first_pending = 0
         load_guild_data()
         log_message("✅ Guild Manager UI initialized successfully")
     except Exception as e:
@@ -1,12 +1,12 @@
 @nightyScript(
-    name="Message Counter v1.0",
+    name="Message Counter v1.9",
     author="simnJS",
     description="Count messages between a specific message ID and now for safe purging operations.",
     usage="<p>count <message_id>"
 )
 def MessageCounterScript():
     """
-    MESSAGE COUNTER SCRIPT v1.0
+    MESSAGE COUNTER SCRIPT v1.9
     ---------------------------
     
     This script counts messages between a specific message ID and the current time.
@@ -16,6 +16,27 @@ def MessageCounterScript():
     <p>count <message_id>  - Count messages in current channel
     <p>count <channel_id> <message_id>  - Count messages in specific channel
     <p>count <guild_id> <channel_id> <message_id>  - Count messages in specific guild/channel
+    <p>count guild [guild_id] <message_id|date>  - Count in every text channel of a server
+    <p>count channels <id,id,...> <message_id|date>  - Count in a list of channels
+    <p>count cancel  - Stop running scans and report their partial counts
+    <p>count stats  - Request/latency/rate-limit statistics for the last count and this session
+    
+    OPTIONS:
+    --fresh  - Drop the channel's local index and rebuild it from history
+    --mode=index  - Answer from the local message index (default)
+    --mode=scan  - Walk the channel history, reusing cached counts for repeat targets
+    --mode=light  - Like scan, but reads only message IDs from the raw API pages
+    --mode=parallel  - Split the range into time windows and scan them concurrently
+    --workers=<n>  - Concurrent windows for --mode=parallel, or concurrent requests
+                     across channels for guild/channels counts (default 4, max 8)
+    --progress  - Keep a live progress message (scanned, pages/s, ETA) while counting
+    
+    FILTERS:
+    --author=<me|user_id,...>  - Only messages from these authors
+    --bots / --no-bots  - Only / no messages from bots
+    --attachments  - Only messages with attachments
+    --match=<regex>  - Only messages whose content matches (case-insensitive, quote spaces)
+    --until=<message_id|date>  - Stop at this message (inclusive) or date
     
     FEATURES:
     - Counts messages from a specific message to the most recent
@@ -23,11 +44,22 @@ def MessageCounterScript():
     - Shows message details and timestamp information
     - Error handling for invalid message IDs
     - Works from any channel/server with proper IDs
+    - Persistent per-channel message ID index (repeat counts answer in milliseconds)
+    - Cached scan results: repeat counts only fetch messages newer than the last run
+    - Parallel time-sliced scanning for large ranges
+    - ID-only pagination: index fills and parallel windows skip building Message objects
+    - Live progress with ETA and cancellation for long scans
+    - Purge plan: bulk-delete batches, 14-day-old singles and estimated delete time
+    - Guild-wide and multi-channel counts with a per-channel breakdown
+    - Filters evaluated per message while streaming; --until alone stays ID-only
+    - Request instrumentation: page latency histogram, rate-limit waits, throughput, estimated bytes
     
     EXAMPLES:
     <p>count 1234567890123456789  - Count in current channel
     <p>count 987654321098765432 1234567890123456789  - Count in specific channel
     <p>count 111222333444555666 987654321098765432 1234567890123456789  - Count in specific server/channel
+    <p>count guild 111222333444555666 2024-06-01  - Count since a date in every channel of a server
+    <p>count channels 987654321098765432,876543210987654321 1234567890123456789  - Count in two channels
     
     USAGE SCENARIO:
     1. Find the message ID you want to purge FROM
@@ -35,20 +67,766 @@ def MessageCounterScript():
     3. Use the count for safe purging operations
     
     NOTES:
-    - Only counts messages in the current channel
-    - Includes the target message in the count
+    - Counts one channel (the current one by default), a list of channels or a
+      whole server; guild and channel-list counts skip channels you cannot read
+    - Single-channel counts include the target message; multi-channel counts
+      start after the given ID or date
     - Provides timestamp information for verification
+    - The index is stored in <scripts>/json/message_counter_index.db and is kept
+      current from message create/delete events while the script is loaded;
+      deletions that happen while Nighty is offline are not seen, use --fresh
+      if a count looks too high
     
     CHANGELOG:
+    v1.9 - Scan instrumentation
+         - Pages fetched, per-page latency histogram and items parsed per second
+         - Time spent waiting on rate limits, read from discord.py's rate-limit logs
+         - Bytes received, sampled from the raw pages
+         - Summary in the result embed and <p>count stats
+    
+    v1.8 - Filtered counting
+         - Added --author, --bots, --no-bots, --attachments, --match and --until
+         - Filters compiled once and checked on raw payloads page by page
+         - --until is answered from snowflake ranges (index and ID-only paths)
+    
+    v1.7 - Guild-wide and multi-channel counting
+         - Added <p>count guild and <p>count channels
+         - Start point can be a message ID/snowflake or an ISO date
+         - Channels counted concurrently under one request budget
+         - Per-channel breakdown, total and combined purge plan
+    
+    v1.6 - Purge plan
+         - Messages older than 14 days counted from snowflake timestamps in the same pass
+         - Results show bulk-delete batches, single deletes and an estimated delete time
+    
+    v1.5 - Progress and cancellation
+         - Added --progress for a throttled live progress message
+         - ETA estimated from snowflake timestamps of scanned pages
+         - Added <p>count cancel, reporting the partial count
+    
+    v1.4 - Lightweight ID-only pagination
+         - Added --mode=light
+         - Pages read from the messages endpoint with after=/limit=100
+         - Only the id field is read, no Message objects are built
+         - Index fills and parallel windows use the lightweight pages
+    
+    v1.3 - Parallel time-sliced scanning
+         - Added --mode=parallel and --workers
+         - Range split into windows on synthetic snowflake boundaries
+         - Windows counted concurrently under a worker limit
+    
+    v1.2 - Incremental count cache
+         - Added --mode=scan for counting without the local index
+         - Scan results cached per channel/target with TTL and LRU bounds
+         - Repeat scans only fetch messages newer than the cached run
+         - Cached counts dropped when deletes are seen in the channel
+    
+    v1.1 - Persistent snowflake index
+         - Message IDs are indexed per channel in SQLite on the first count
+         - Later counts only fetch messages newer than the last indexed ID
+         - Index kept current from gateway message create/delete events
+    
     v1.0 - Initial release
          - Message counting functionality
          - Timestamp and date information
          - Safe purge calculation
          - Error handling for invalid IDs
     """
+    import asyncio
+    import bisect
     import discord
+    import json
+    import logging
+    import os
+    import re
+    import shlex
+    import sqlite3
+    import time
+    from collections import OrderedDict
     from datetime import datetime, timezone
     
+    INDEX_PATH = os.path.join(getScriptsPath(), "json", "message_counter_index.db")
+    INDEX_BATCH_SIZE = 500
+    HISTORY_PAGE_SIZE = 100  # API maximum for the messages endpoint
+    
+    # Channels whose index is known to be contiguous with the gateway feed.
+    # Cleared on disconnect since events may be missed until the next top-up.
+    live_channels = set()
+    filling_channels = set()  # channels whose first index fill is running
+    index_locks = {}
+    
+    DISCORD_EPOCH = 1420070400000  # ms
+    
+    PARALLEL_DEFAULT_WORKERS = 4
+    # discord.py queues requests per rate-limit bucket, and history pages for a
+    # channel share one bucket, so more workers than this only adds waiting
+    PARALLEL_MAX_WORKERS = 8
+    PARALLEL_WINDOWS_PER_WORKER = 4
+    
+    PROGRESS_EDIT_INTERVAL = 5  # seconds between progress message edits
+    
+    FILTER_OPTIONS = ["author", "bots", "no-bots", "attachments", "match", "until"]
+    
+    MULTI_CHANNEL_BREAKDOWN_LIMIT = 25  # channel lines shown in multi-channel results
+    
+    LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]  # seconds, last bucket is open-ended
+    STATS_BYTES_SAMPLE_EVERY = 10  # re-encode one raw page in this many to estimate bytes received
+    
+    PURGE_BULK_LIMIT = 100  # messages per bulk-delete request
+    PURGE_BULK_MAX_AGE_DAYS = 14  # older messages must be deleted one at a time
+    # Pacing of the delete routes under Discord's per-channel rate limits
+    BULK_DELETE_INTERVAL = 1.0  # seconds per bulk-delete request
+    SINGLE_DELETE_INTERVAL = 1.0  # seconds per single delete
+    
+    COUNT_CACHE_TTL = 600  # seconds
+    COUNT_CACHE_SIZE = 128
+    
+    # (channel_id, target_id, filter_key) -> {"count", "old_count", "newest_id", "stored_at"},
+    # least recently used first
+    count_cache = OrderedDict()
+    
+    # Running scans by command message ID, so <p>count cancel can reach them
+    active_scans = {}
+    
+    class ScanCancelled(Exception):
+        pass
+    
+    def new_stats():
+        """Request instrumentation for one count run (shared by its child scans)"""
+        return {
+            "requests": 0,
+            "items": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+            "latency_buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+            "rate_limit_hits": 0,
+            "rate_limit_wait": 0.0,
+            "sampled_bytes": 0,
+            "sampled_items": 0,
+            "elapsed": 0.0,
+            "runs": 0
+        }
+    
+    last_stats = None
+    session_stats = new_stats()
+    
+    def snowflake_time_ms(snowflake):
+        return (snowflake >> 22) + DISCORD_EPOCH
+    
+    def snowflake_from_time_ms(timestamp_ms):
+        """Smallest snowflake that could have been created at timestamp_ms"""
+        return max(int(timestamp_ms) - DISCORD_EPOCH, 0) << 22
+    
+    def new_scan(workers, parent=None):
+        """Create the progress/cancellation state shared by a count run
+        
+        Child scans (one per channel in multi-channel counts) share the parent's
+        cancel flag, cutoff and request budget, and are summed for progress.
+        """
+        bulk_cutoff_ms = time.time() * 1000 - PURGE_BULK_MAX_AGE_DAYS * 86400000
+        scan = {
+            "workers": workers,
+            "cutoff_id": parent["cutoff_id"] if parent else snowflake_from_time_ms(bulk_cutoff_ms),
+            "base_count": 0,
+            "scanned": 0,
+            "matched": 0,
+            "pages": 0,
+            "covered_ms": 0,
+            "total_ms": 0,
+            "started_at": time.monotonic(),
+            "cancel": parent["cancel"] if parent else asyncio.Event(),
+            "request_budget": parent["request_budget"] if parent else None,
+            "before_id": parent["before_id"] if parent else None,
+            "predicate": parent["predicate"] if parent else None,
+            "filter_key": parent["filter_key"] if parent else "",
+            "channel_id": None,
+            "stats": parent["stats"] if parent else new_stats(),
+            "children": []
+        }
+        if parent:
+            parent["children"].append(scan)
+        return scan
+    
+    def scan_totals(scan):
+        """Sum progress counters over a scan and its child scans"""
+        totals = {key: scan[key] for key in ("scanned", "pages", "covered_ms", "total_ms")}
+        for child in scan["children"]:
+            for key in totals:
+                totals[key] += child[key]
+        return totals
+    
+    def partial_count(scan):
+        """Messages already counted when a scan stops early; under a filter only matches count"""
+        return scan["base_count"] + (scan["matched"] if scan["predicate"] else scan["scanned"])
+    
+    def record_request(stats, seconds, items, page=None):
+        """Record one page request; raw pages are occasionally re-encoded to estimate bytes"""
+        if stats is None:
+            return
+        stats["requests"] += 1
+        stats["items"] += items
+        stats["latency_total"] += seconds
+        stats["latency_max"] = max(stats["latency_max"], seconds)
+        stats["latency_buckets"][bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if page and stats["requests"] % STATS_BYTES_SAMPLE_EVERY == 1:
+            stats["sampled_bytes"] += len(json.dumps(page, separators=(",", ":"), ensure_ascii=False).encode())
+            stats["sampled_items"] += len(page)
+    
+    def merge_stats(into, stats):
+        for key, value in stats.items():
+            if key == "latency_max":
+                into[key] = max(into[key], value)
+            elif key == "latency_buckets":
+                into[key] = [a + b for a, b in zip(into[key], value)]
+            else:
+                into[key] += value
+    
+    class RateLimitLogHandler(logging.Handler):
+        """Pick up discord.py's "Retrying in X seconds" rate-limit warnings for running scans
+        
+        Only history page requests (GET /channels/{id}/messages) are counted, and
+        only against the scan reading that channel; other routes are ignored.
+        """
+        
+        RETRY_PATTERN = re.compile(r"[Rr]etrying in ([\d.]+) seconds")
+        ROUTE_PATTERN = re.compile(r"GET \S*/channels/(\d+)/messages(?![/\w])")
+        
+        def emit(self, record):
+            try:
+                message = record.getMessage()
+            except Exception:
+                return
+            match = self.RETRY_PATTERN.search(message)
+            route = self.ROUTE_PATTERN.search(message)
+            if not match or not route:
+                return
+            scan = find_scan_for_channel(int(route.group(1)))
+            if scan:
+                scan["stats"]["rate_limit_hits"] += 1
+                scan["stats"]["rate_limit_wait"] += float(match.group(1))
+    
+    def find_scan_for_channel(channel_id):
+        """Running scan (or child scan) reading channel_id, if any"""
+        for scan in active_scans.values():
+            for candidate in [scan] + scan["children"]:
+                if candidate["channel_id"] == channel_id:
+                    return candidate
+        return None
+    
+    discord_http_logger = logging.getLogger("discord.http")
+    for handler in list(discord_http_logger.handlers):
+        # Replace the handler left behind if the script is reloaded
+        if handler.get_name() == "message_counter_rate_limits":
+            discord_http_logger.removeHandler(handler)
+    rate_limit_handler = RateLimitLogHandler(level=logging.WARNING)
+    rate_limit_handler.set_name("message_counter_rate_limits")
+    discord_http_logger.addHandler(rate_limit_handler)
+    
+    def count_older(page, cutoff_id):
+        """Count IDs in a page created before the bulk-delete cutoff"""
+        if max(page) < cutoff_id:
+            return len(page)
+        if min(page) >= cutoff_id:
+            return 0
+        return sum(1 for message_id in page if message_id < cutoff_id)
+    
+    def scan_begin(scan, base_count, total_ms):
+        scan["base_count"] = base_count
+        scan["total_ms"] = max(total_ms, 0)
+    
+    async def next_page(scan, pages):
+        """Fetch the next page within the request budget, or None at the end"""
+        budget = scan["request_budget"]
+        try:
+            if budget:
+                # Shared across channels so the whole run stays within one request budget
+                async with budget:
+                    page = await pages.__anext__()
+            else:
+                page = await pages.__anext__()
+        except StopAsyncIteration:
+            return None
+        if scan["cancel"].is_set():
+            raise ScanCancelled()
+        return page
+    
+    def record_page(scan, page_ids, cursor_ms):
+        """Add a page to the progress counters and return the new time cursor"""
+        newest_ms = snowflake_time_ms(max(page_ids))
+        scan["scanned"] += len(page_ids)
+        scan["pages"] += 1
+        scan["covered_ms"] += max(newest_ms - cursor_ms, 0)
+        return max(cursor_ms, newest_ms)
+    
+    async def track_pages(scan, pages, after_id):
+        """Record progress for each page and stop the scan once it is cancelled"""
+        cursor_ms = snowflake_time_ms(after_id)
+        while True:
+            page = await next_page(scan, pages)
+            if page is None:
+                return
+            cursor_ms = record_page(scan, page, cursor_ms)
+            yield page
+    
+    def open_index():
+        """Open (and create if needed) the on-disk message ID index"""
+        os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+        conn = sqlite3.connect(INDEX_PATH)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS indexed_messages ("
+            "channel_id INTEGER NOT NULL, message_id INTEGER NOT NULL, "
+            "PRIMARY KEY (channel_id, message_id)) WITHOUT ROWID"
+        )
+        # Every message with low_id < message_id <= high_id is in indexed_messages
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS indexed_ranges ("
+            "channel_id INTEGER PRIMARY KEY, low_id INTEGER NOT NULL, high_id INTEGER NOT NULL)"
+        )
+        conn.commit()
+        return conn
+    
+    index_db = open_index()
+    # Ranges are mirrored in memory so on_message can skip unindexed channels without a query
+    indexed_ranges = {
+        channel_id: (low_id, high_id)
+        for channel_id, low_id, high_id in index_db.execute("SELECT channel_id, low_id, high_id FROM indexed_ranges")
+    }
+    
+    def index_get_range(channel_id):
+        return indexed_ranges.get(channel_id)
+    
+    def index_set_range(channel_id, low_id, high_id):
+        indexed_ranges[channel_id] = (low_id, high_id)
+        with index_db:
+            index_db.execute(
+                "INSERT OR REPLACE INTO indexed_ranges (channel_id, low_id, high_id) VALUES (?, ?, ?)",
+                (channel_id, low_id, high_id)
+            )
+    
+    def index_add(channel_id, message_ids):
+        with index_db:
+            index_db.executemany(
+                "INSERT OR IGNORE INTO indexed_messages (channel_id, message_id) VALUES (?, ?)",
+                [(channel_id, message_id) for message_id in message_ids]
+            )
+    
+    def index_remove(channel_id, message_ids):
+        with index_db:
+            index_db.executemany(
+                "DELETE FROM indexed_messages WHERE channel_id = ? AND message_id = ?",
+                [(channel_id, message_id) for message_id in message_ids]
+            )
+    
+    def index_drop_channel(channel_id):
+        live_channels.discard(channel_id)
+        indexed_ranges.pop(channel_id, None)
+        with index_db:
+            index_db.execute("DELETE FROM indexed_messages WHERE channel_id = ?", (channel_id,))
+            index_db.execute("DELETE FROM indexed_ranges WHERE channel_id = ?", (channel_id,))
+    
+    def index_count_after(channel_id, after_id):
+        """Count indexed messages newer than after_id (B-tree range search on the primary key)"""
+        return index_db.execute(
+            "SELECT COUNT(*) FROM indexed_messages WHERE channel_id = ? AND message_id > ?",
+            (channel_id, after_id)
+        ).fetchone()[0]
+    
+    def index_count_between(channel_id, after_id, before_id):
+        """Count indexed messages in (after_id, before_id)"""
+        return index_db.execute(
+            "SELECT COUNT(*) FROM indexed_messages WHERE channel_id = ? AND message_id > ? AND message_id < ?",
+            (channel_id, after_id, before_id)
+        ).fetchone()[0]
+    
+    async def fetch_history_id_pages(channel, after_id, before_id=None, stats=None):
+        """Yield pages of message IDs in (after_id, before_id) built from full Message objects"""
+        before = discord.Object(id=before_id) if before_id is not None else None
+        page = []
+        page_started = time.perf_counter()
+        async for message in channel.history(after=discord.Object(id=after_id), before=before, limit=None, oldest_first=True):
+            page.append(message.id)
+            if len(page) >= HISTORY_PAGE_SIZE:
+                # history() hides its requests, so a page's latency includes building its Messages
+                record_request(stats, time.perf_counter() - page_started, len(page))
+                yield page
+                page = []
+                page_started = time.perf_counter()
+        record_request(stats, time.perf_counter() - page_started, len(page))
+        if page:
+            yield page
+    
+    async def fetch_raw_pages(channel, after_id, before_id=None, stats=None):
+        """Yield raw message payload pages in (after_id, before_id) straight from the messages endpoint"""
+        cursor = after_id
+        while True:
+            # The API honours only one of before/after, so the upper bound is applied here
+            request_started = time.perf_counter()
+            page = await bot.http.logs_from(channel.id, HISTORY_PAGE_SIZE, after=cursor)
+            record_request(stats, time.perf_counter() - request_started, len(page), page)
+            if not page:
+                return
+            cursor = max(int(item["id"]) for item in page)
+            if before_id is not None and cursor >= before_id:
+                page = [item for item in page if int(item["id"]) < before_id]
+                if page:
+                    yield page
+                return
+            yield page
+            if len(page) < HISTORY_PAGE_SIZE:
+                return
+    
+    async def fetch_id_pages(channel, after_id, before_id=None, stats=None):
+        """Yield pages of message IDs in (after_id, before_id) without building Message objects"""
+        async for page in fetch_raw_pages(channel, after_id, before_id, stats):
+            yield [int(item["id"]) for item in page]
+    
+    async def index_fill(channel_id, channel, after_id, scan, before_id=None):
+        """Index every message in (after_id, before_id) and return (fetched, newest_id)"""
+        fetched = 0
+        newest_id = None
+        batch = []
+        pages = fetch_id_pages(channel, after_id, before_id, scan["stats"])
+        try:
+            async for page in track_pages(scan, pages, after_id):
+                batch.extend(page)
+                fetched += len(page)
+                newest_id = max(page) if newest_id is None else max(newest_id, max(page))
+                if len(batch) >= INDEX_BATCH_SIZE:
+                    index_add(channel_id, batch)
+                    batch = []
+        finally:
+            # Keep what was fetched before a cancel; the range is only moved on success
+            if batch:
+                index_add(channel_id, batch)
+        return fetched, newest_id
+    
+    async def count_raw_range(channel, low_id, before_id, scan):
+        """Count messages in (low_id, before_id) that pass the scan's filter predicate
+        
+        Reads raw payloads page by page; nothing is buffered beyond the current page.
+        Returns (matched, old_matched, newest_id) where newest_id covers every scanned message.
+        """
+        predicate = scan["predicate"]
+        cutoff_id = scan["cutoff_id"]
+        matched = 0
+        old_matched = 0
+        newest_id = low_id
+        cursor_ms = snowflake_time_ms(low_id)
+        pages = fetch_raw_pages(channel, low_id, before_id, scan["stats"])
+        while True:
+            page = await next_page(scan, pages)
+            if page is None:
+                return matched, old_matched, newest_id
+            page_ids = [int(item["id"]) for item in page]
+            cursor_ms = record_page(scan, page_ids, cursor_ms)
+            newest_id = max(newest_id, max(page_ids))
+            for item, message_id in zip(page, page_ids):
+                if predicate(item):
+                    matched += 1
+                    scan["matched"] += 1
+                    if message_id < cutoff_id:
+                        old_matched += 1
+    
+    async def count_with_index(channel, after_id, scan):
+        """Count messages after after_id using the local index, fetching only what it is missing"""
+        channel_id = channel.id
+        lock = index_locks.setdefault(channel_id, asyncio.Lock())
+        async with lock:
+            fetched = 0
+            indexed_range = index_get_range(channel_id)
+            now_ms = int(time.time() * 1000)
+            
+            if indexed_range is None:
+                scan_begin(scan, 0, now_ms - snowflake_time_ms(after_id))
+                # Messages sent while the last page is in flight are recorded by on_message
+                filling_channels.add(channel_id)
+                try:
+                    newly_fetched, newest_id = await index_fill(channel_id, channel, after_id, scan)
+                finally:
+                    filling_channels.discard(channel_id)
+                fetched += newly_fetched
+                index_set_range(channel_id, after_id, newest_id or after_id)
+                live_channels.add(channel_id)
+            else:
+                low_id, high_id = indexed_range
+                
+                total_ms = 0
+                if after_id < low_id:
+                    total_ms += snowflake_time_ms(low_id) - snowflake_time_ms(after_id)
+                if channel_id not in live_channels:
+                    total_ms += now_ms - snowflake_time_ms(high_id)
+                scan_begin(scan, index_count_after(channel_id, after_id), total_ms)
+                
+                if after_id < low_id:
+                    # Backfill the gap below the indexed range, low_id itself included
+                    newly_fetched, _ = await index_fill(channel_id, channel, after_id, scan, low_id + 1)
+                    fetched += newly_fetched
+                    low_id = after_id
+                    index_set_range(channel_id, low_id, high_id)
+                
+                if channel_id not in live_channels:
+                    newly_fetched, newest_id = await index_fill(channel_id, channel, high_id, scan)
+                    fetched += newly_fetched
+                    index_set_range(channel_id, low_id, max(high_id, newest_id or high_id))
+                    live_channels.add(channel_id)
+            
+            before_id = scan["before_id"]
+            if before_id is None:
+                count = index_count_after(channel_id, after_id)
+                old_count = index_count_between(channel_id, after_id, scan["cutoff_id"])
+            else:
+                count = index_count_between(channel_id, after_id, before_id)
+                old_count = index_count_between(channel_id, after_id, min(scan["cutoff_id"], before_id))
+            
+            return {
+                "count": count,
+                "old_count": old_count,
+                "fetched": fetched,
+                "source": "index"
+            }
+    
+    def count_cache_get(channel_id, target_id, filter_key):
+        key = (channel_id, target_id, filter_key)
+        entry = count_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry["stored_at"] > COUNT_CACHE_TTL:
+            del count_cache[key]
+            return None
+        count_cache.move_to_end(key)
+        return entry
+    
+    def count_cache_put(channel_id, target_id, filter_key, count, old_count, newest_id):
+        key = (channel_id, target_id, filter_key)
+        count_cache[key] = {
+            "count": count,
+            "old_count": old_count,
+            "newest_id": newest_id,
+            "stored_at": time.monotonic()
+        }
+        count_cache.move_to_end(key)
+        while len(count_cache) > COUNT_CACHE_SIZE:
+            count_cache.popitem(last=False)
+    
+    def count_cache_drop_channel(channel_id):
+        for key in [key for key in count_cache if key[0] == channel_id]:
+            del count_cache[key]
+    
+    async def count_with_walk(channel, after_id, scan, fetch_pages, source):
+        """Count messages after after_id by walking history, topping up a cached count when possible"""
+        entry = count_cache_get(channel.id, after_id, scan["filter_key"])
+        if entry:
+            count, old_count, newest_id = entry["count"], entry["old_count"], entry["newest_id"]
+        else:
+            count, old_count, newest_id = 0, 0, after_id
+        scan_begin(scan, count, scan_end_ms(scan) - snowflake_time_ms(newest_id))
+        
+        fetched = 0
+        pages = fetch_pages(channel, newest_id, scan["before_id"], scan["stats"])
+        async for page in track_pages(scan, pages, newest_id):
+            fetched += len(page)
+            old_count += count_older(page, scan["cutoff_id"])
+            newest_id = max(newest_id, max(page))
+        count += fetched
+        
+        count_cache_put(channel.id, after_id, scan["filter_key"], count, old_count, newest_id)
+        return {
+            "count": count,
+            "old_count": old_count,
+            "fetched": fetched,
+            "source": "cache" if entry else source
+        }
+    
+    async def count_with_scan(channel, after_id, scan):
+        return await count_with_walk(channel, after_id, scan, fetch_history_id_pages, "scan")
+    
+    async def count_with_light(channel, after_id, scan):
+        return await count_with_walk(channel, after_id, scan, fetch_id_pages, "light")
+    
+    async def count_with_filters(channel, after_id, scan):
+        """Count messages after after_id that pass the filters, topping up a cached count when possible"""
+        entry = count_cache_get(channel.id, after_id, scan["filter_key"])
+        if entry:
+            count, old_count, start_id = entry["count"], entry["old_count"], entry["newest_id"]
+        else:
+            count, old_count, start_id = 0, 0, after_id
+        scan_begin(scan, count, scan_end_ms(scan) - snowflake_time_ms(start_id))
+        
+        matched, old_matched, newest_id = await count_raw_range(channel, start_id, scan["before_id"], scan)
+        count += matched
+        old_count += old_matched
+        
+        count_cache_put(channel.id, after_id, scan["filter_key"], count, old_count, newest_id)
+        return {
+            "count": count,
+            "old_count": old_count,
+            "fetched": scan["scanned"],
+            "source": "cache" if entry else "filtered"
+        }
+    
+    async def count_with_parallel(channel, after_id, scan):
+        """Count messages after after_id by scanning time windows concurrently"""
+        entry = count_cache_get(channel.id, after_id, scan["filter_key"])
+        if entry:
+            base_count, base_old_count, start_id = entry["count"], entry["old_count"], entry["newest_id"]
+        else:
+            base_count, base_old_count, start_id = 0, 0, after_id
+        
+        workers = scan["workers"]
+        start_ms = snowflake_time_ms(start_id)
+        end_ms = scan_end_ms(scan)
+        scan_begin(scan, base_count, end_ms - start_ms)
+        window_count = max(1, workers * PARALLEL_WINDOWS_PER_WORKER)
+        window_ms = max(1, (end_ms - start_ms) // window_count)
+        
+        # Window i covers (bounds[i], bounds[i + 1]]; without --until the last one
+        # is open-ended so messages sent during the scan are still counted
+        bounds = [start_id]
+        for i in range(1, window_count):
+            boundary = snowflake_from_time_ms(start_ms + i * window_ms)
+            if boundary > bounds[-1] and (scan["before_id"] is None or boundary < scan["before_id"] - 1):
+                bounds.append(boundary)
+        bounds.append(scan["before_id"] - 1 if scan["before_id"] is not None else None)
+        
+        semaphore = asyncio.Semaphore(workers)
+        
+        async def count_window(low_id, high_id):
+            async with semaphore:
+                before_id = high_id + 1 if high_id is not None else None
+                if scan["predicate"]:
+                    return await count_raw_range(channel, low_id, before_id, scan)
+                fetched = 0
+                old_count = 0
+                newest_id = low_id
+                pages = fetch_id_pages(channel, low_id, before_id, scan["stats"])
+                async for page in track_pages(scan, pages, low_id):
+                    fetched += len(page)
+                    old_count += count_older(page, scan["cutoff_id"])
+                    newest_id = max(newest_id, max(page))
+                return fetched, old_count, newest_id
+        
+        results = await asyncio.gather(*[
+            count_window(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)
+        ], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        
+        fetched = sum(result[0] for result in results)
+        old_count = base_old_count + sum(result[1] for result in results)
+        newest_id = max(result[2] for result in results)
+        count = base_count + fetched
+        
+        count_cache_put(channel.id, after_id, scan["filter_key"], count, old_count, newest_id)
+        return {
+            "count": count,
+            "old_count": old_count,
+            "fetched": scan["scanned"],
+            "source": "cache" if entry else "parallel",
+            "windows": len(bounds) - 1
+        }
+    
+    COUNT_MODES = {
+        "index": count_with_index,
+        "scan": count_with_scan,
+        "light": count_with_light,
+        "parallel": count_with_parallel
+    }
+    
+    def pick_count_mode(mode, scan):
+        """Message filters need payloads, which the index and history() paths don't keep"""
+        if scan["predicate"] and mode != "parallel":
+            return count_with_filters
+        return COUNT_MODES[mode]
+    
+    def scan_end_ms(scan):
+        if scan["before_id"] is not None:
+            return min(snowflake_time_ms(scan["before_id"]), int(time.time() * 1000))
+        return int(time.time() * 1000)
+    
+    def compile_filters(options, scan):
+        """Compile filter options once into the scan's upper bound and per-message predicate
+        
+        Returns a short description of the active filters, or None when there are none.
+        Raises ValueError for malformed filter values.
+        """
+        checks = []
+        labels = []
+        
+        for name in ("author", "match", "until"):
+            if name in options and (options[name] is True or not str(options[name]).strip()):
+                raise ValueError(f"`--{name}` needs a value, e.g. `--{name}=...`")
+        
+        if "author" in options:
+            author_ids = set()
+            for value in str(options["author"]).split(","):
+                author_ids.add(bot.user.id if value.lower() == "me" else int(value))
+            checks.append(lambda item: int(item["author"]["id"]) in author_ids)
+            labels.append(f"author {options['author']}")
+        if "bots" in options:
+            checks.append(lambda item: item["author"].get("bot", False))
+            labels.append("bots only")
+        if "no-bots" in options:
+            checks.append(lambda item: not item["author"].get("bot", False))
+            labels.append("no bots")
+        if "attachments" in options:
+            checks.append(lambda item: bool(item.get("attachments")))
+            labels.append("with attachments")
+        if "match" in options:
+            try:
+                pattern = re.compile(str(options["match"]), re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"invalid regex: {e}")
+            checks.append(lambda item: pattern.search(item.get("content") or "") is not None)
+            labels.append(f"matching `{options['match']}`")
+        if "until" in options:
+            # Decided from snowflakes alone, so it only narrows the scanned range
+            scan["before_id"] = parse_start_point(str(options["until"])) + 1
+            labels.append(f"until `{options['until']}`")
+        
+        if len(checks) == 1:
+            scan["predicate"] = checks[0]
+        elif checks:
+            scan["predicate"] = lambda item: all(check(item) for check in checks)
+        scan["filter_key"] = " ".join(sorted(f"{name}={options[name]}" for name in FILTER_OPTIONS if name in options))
+        return ", ".join(labels) if labels else None
+    
+    def message_payload(message):
+        """Minimal raw-payload view of a Message so filters can be applied to it"""
+        return {
+            "id": str(message.id),
+            "author": {"id": str(message.author.id), "bot": message.author.bot},
+            "attachments": message.attachments,
+            "content": message.content
+        }
+    
+    @bot.listen("on_message")
+    async def message_counter_on_message(message):
+        channel_id = message.channel.id
+        indexed_range = index_get_range(channel_id)
+        if indexed_range is None and channel_id not in filling_channels:
+            return
+        # Always record the ID; only advance the contiguous range while live
+        index_add(channel_id, [message.id])
+        if channel_id in live_channels and indexed_range is not None and message.id > indexed_range[1]:
+            index_set_range(channel_id, indexed_range[0], message.id)
+    
+    @bot.listen("on_raw_message_delete")
+    async def message_counter_on_delete(payload):
+        index_remove(payload.channel_id, [payload.message_id])
+        count_cache_drop_channel(payload.channel_id)
+    
+    @bot.listen("on_raw_bulk_message_delete")
+    async def message_counter_on_bulk_delete(payload):
+        index_remove(payload.channel_id, list(payload.message_ids))
+        count_cache_drop_channel(payload.channel_id)
+    
+    @bot.listen("on_disconnect")
+    async def message_counter_on_disconnect():
+        live_channels.clear()
+    
     async def send_embed_safely(channel_id, content, title):
         """Helper function to send embed while temporarily disabling private mode"""
         # Backup and disable private mode for embed
@@ -99,6 +877,234 @@ def MessageCounterScript():
                 return f"{minutes} minute(s) ago"
         except:
             return "Unknown"
+    
+    def format_duration(seconds):
+        """Format a duration in seconds as a short human readable string"""
+        seconds = int(seconds)
+        if seconds >= 3600:
+            return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+        if seconds >= 60:
+            return f"{seconds // 60}m {seconds % 60}s"
+        return f"{seconds}s"
+    
+    def format_progress(scan, location_info):
+        """Build the live progress text for a running scan"""
+        totals = scan_totals(scan)
+        elapsed = max(time.monotonic() - scan["started_at"], 0.001)
+        pages_per_second = totals["pages"] / elapsed
+        
+        if totals["total_ms"] > 0 and totals["covered_ms"] > 0:
+            fraction = min(totals["covered_ms"] / totals["total_ms"], 1.0)
+            eta = format_duration(elapsed * (1 - fraction) / fraction)
+            progress_line = f"• Progress: **{fraction:.0%}** (ETA {eta})"
+        else:
+            progress_line = "• Progress: estimating..."
+        
+        return f"""⏳ **Counting messages in {location_info}...**
+• Scanned: **{totals['scanned']:,}** message(s) in {totals['pages']:,} page(s)
+• Speed: {pages_per_second:.1f} pages/s
+{progress_line}
+• Elapsed: {format_duration(elapsed)}
+
+Use `<p>count cancel` to stop and get the partial count."""
+    
+    def build_purge_plan(message_count, old_count, target_id, cutoff_id):
+        """Split a purge of the target (if any) and everything after it into bulk and single deletes"""
+        target_count = 1 if target_id is not None else 0
+        single_count = old_count + (1 if target_count and target_id < cutoff_id else 0)
+        bulk_count = message_count + target_count - single_count
+        if bulk_count % PURGE_BULK_LIMIT == 1:
+            # Bulk delete needs at least two messages, so a lone leftover is deleted on its own
+            bulk_count -= 1
+            single_count += 1
+        bulk_batches = -(-bulk_count // PURGE_BULK_LIMIT)
+        return {
+            "bulk_count": bulk_count,
+            "bulk_batches": bulk_batches,
+            "single_count": single_count,
+            "estimated_seconds": bulk_batches * BULK_DELETE_INTERVAL + single_count * SINGLE_DELETE_INTERVAL
+        }
+    
+    def parse_start_point(value):
+        """Turn a message ID/snowflake or an ISO date (UTC) into an exclusive after_id"""
+        if value.isdigit():
+            return int(value)
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return max(snowflake_from_time_ms(dt.timestamp() * 1000) - 1, 0)
+    
+    async def count_across_channels(channels, after_id, mode, scan):
+        """Count messages after after_id in several channels concurrently
+        
+        Returns one (channel, result, status) tuple per channel, where status is
+        None on success or a short reason the channel was skipped or stopped.
+        """
+        scan["request_budget"] = asyncio.Semaphore(scan["workers"])
+        
+        async def count_channel(channel):
+            child = new_scan(scan["workers"], scan)
+            child["channel_id"] = channel.id
+            try:
+                return channel, await pick_count_mode(mode, child)(channel, after_id, child), None
+            except ScanCancelled:
+                return channel, {"count": partial_count(child), "old_count": 0}, "cancelled"
+            except discord.Forbidden:
+                return channel, None, "no access"
+            except discord.HTTPException as e:
+                return channel, None, f"error: {e}"
+        
+        return await asyncio.gather(*[count_channel(channel) for channel in channels])
+    
+    async def count_multi_channel(ctx, channels, after_id, location_info, mode, scan, options, filter_info):
+        """Run and report a guild-wide or channel-list count"""
+        print(f"Counting messages after {after_id} in {location_info}", type_="INFO")
+        
+        progress_message = None
+        progress_task = None
+        if "progress" in options:
+            progress_message = await ctx.send(format_progress(scan, location_info))
+            progress_task = asyncio.create_task(report_progress(progress_message, scan, location_info))
+        
+        active_scans[ctx.message.id] = scan
+        try:
+            results = await count_across_channels(channels, after_id, mode, scan)
+        finally:
+            active_scans.pop(ctx.message.id, None)
+            finish_stats(scan)
+            if progress_task:
+                progress_task.cancel()
+            if progress_message:
+                try:
+                    await progress_message.delete()
+                except discord.HTTPException:
+                    pass
+        
+        total_count = 0
+        counted_channels = 0
+        bulk_count = bulk_batches = single_count = 0
+        estimated_seconds = 0
+        cancelled = False
+        lines = []
+        
+        for channel, result, status in sorted(results, key=lambda item: -(item[1] or {}).get("count", 0)):
+            if result is None:
+                lines.append(f"• #{channel.name}: 🔒 {status}")
+                continue
+            total_count += result["count"]
+            if status == "cancelled":
+                cancelled = True
+                lines.append(f"• #{channel.name}: at least **{result['count']:,}** (cancelled)")
+                continue
+            counted_channels += 1
+            plan = build_purge_plan(result["count"], result["old_count"], None, scan["cutoff_id"])
+            bulk_count += plan["bulk_count"]
+            bulk_batches += plan["bulk_batches"]
+            single_count += plan["single_count"]
+            estimated_seconds += plan["estimated_seconds"]
+            lines.append(f"• #{channel.name}: **{result['count']:,}**")
+        
+        if len(lines) > MULTI_CHANNEL_BREAKDOWN_LIMIT:
+            hidden = len(lines) - MULTI_CHANNEL_BREAKDOWN_LIMIT
+            lines = lines[:MULTI_CHANNEL_BREAKDOWN_LIMIT] + [f"• ...and {hidden} more channel(s)"]
+        breakdown = "\n".join(lines) if lines else "• No channels to count"
+        
+        after_time = format_timestamp(datetime.fromtimestamp(snowflake_time_ms(after_id) / 1000, timezone.utc))
+        filter_line = f"\n**🔎 Filters:** {filter_info}" if filter_info else ""
+        total_label = "at least " if cancelled else ""
+        
+        content = f"""📊 **Multi-Channel Count Results**
+
+**After:** `{after_id}` ({after_time})
+**Location:** {location_info}{filter_line}
+
+**📈 Per channel:**
+{breakdown}
+
+**Total:** {total_label}**{total_count:,}** message(s) across {counted_channels:,} channel(s)
+
+**🧹 Purge Plan:**
+• Bulk delete: **{bulk_count:,}** message(s) in **{bulk_batches:,}** batch(es) of up to {PURGE_BULK_LIMIT}
+• One by one: **{single_count:,}** message(s) (older than {PURGE_BULK_MAX_AGE_DAYS} days, or too few for a bulk batch)
+• Estimated delete time: ~{format_duration(estimated_seconds)}
+
+**📡 Requests:** {format_stats_summary(scan['stats'])}"""
+        
+        if cancelled:
+            content = "🛑 **Count cancelled** - partial results below\n\n" + content
+        
+        await send_embed_safely(
+            ctx.channel.id,
+            content,
+            "Message Counter Results"
+        )
+        print(f"✅ Multi-channel count completed: {total_count} messages across {counted_channels} channels", type_="SUCCESS")
+    
+    def finish_stats(scan):
+        """Close a run's statistics and fold them into the session totals"""
+        nonlocal last_stats
+        stats = scan["stats"]
+        stats["elapsed"] = time.monotonic() - scan["started_at"]
+        stats["runs"] = 1
+        last_stats = stats
+        merge_stats(session_stats, stats)
+    
+    def format_bytes(value):
+        if value >= 1048576:
+            return f"{value / 1048576:.1f} MB"
+        if value >= 1024:
+            return f"{value / 1024:.1f} KB"
+        return f"{int(value)} B"
+    
+    def estimated_bytes(stats):
+        if not stats["sampled_items"]:
+            return None
+        return stats["sampled_bytes"] / stats["sampled_items"] * stats["items"]
+    
+    def format_stats_summary(stats):
+        """One-line request summary for result embeds"""
+        if not stats["requests"]:
+            return "no requests needed"
+        average_ms = stats["latency_total"] / stats["requests"] * 1000
+        summary = f"{stats['requests']:,} page(s), avg {average_ms:.0f} ms"
+        if stats["rate_limit_hits"]:
+            summary += f", {stats['rate_limit_hits']} rate limit(s) ({stats['rate_limit_wait']:.1f}s waiting)"
+        received = estimated_bytes(stats)
+        if received is not None:
+            summary += f", ≈{format_bytes(received)} received (est.)"
+        return summary
+    
+    def format_stats_details(stats):
+        """Detailed statistics block for <p>count stats"""
+        requests = stats["requests"]
+        if not requests:
+            return "• No page requests recorded"
+        
+        elapsed = max(stats["elapsed"], 0.001)
+        average_ms = stats["latency_total"] / requests * 1000
+        bucket_labels = [f"<{int(limit * 1000)}ms" if limit < 1 else f"<{limit:g}s" for limit in LATENCY_BUCKETS]
+        bucket_labels.append(f"≥{LATENCY_BUCKETS[-1]:g}s")
+        histogram = " • ".join(
+            f"{label}: {count:,}" for label, count in zip(bucket_labels, stats["latency_buckets"]) if count
+        )
+        received = estimated_bytes(stats)
+        
+        return f"""• Runs: {stats['runs']:,} over {format_duration(elapsed)} of scanning
+• Pages fetched: **{requests:,}** ({requests / elapsed:.1f}/s)
+• Page latency: avg {average_ms:.0f} ms, max {stats['latency_max'] * 1000:.0f} ms
+• Histogram: {histogram}
+• Rate limits: {stats['rate_limit_hits']:,} hit(s), {stats['rate_limit_wait']:.1f}s waiting ({stats['rate_limit_wait'] / elapsed:.0%} of the time)
+• Items parsed: **{stats['items']:,}** ({stats['items'] / elapsed:,.0f}/s)
+• Received (estimated from sampled pages): {f"≈{format_bytes(received)}" if received is not None else "n/a (history scans don't expose payloads)"}"""
+    
+    async def report_progress(progress_message, scan, location_info):
+        """Edit the progress message at a throttled rate until cancelled"""
+        while True:
+            await asyncio.sleep(PROGRESS_EDIT_INTERVAL)
+            try:
+                await progress_message.edit(content=format_progress(scan, location_info))
+            except discord.HTTPException:
+                pass
 
     @bot.command(name="count", usage="<message_id> OR <channel_id> <message_id> OR <guild_id> <channel_id> <message_id>", description="Count messages from message ID to now")
     async def count_messages(ctx, *, args: str = None):
@@ -107,12 +1113,62 @@ def MessageCounterScript():
         if not args:
             await send_embed_safely(
                 ctx.channel.id,
-                "❌ **Usage:**\n• `<p>count <message_id>` - Count in current channel\n• `<p>count <channel_id> <message_id>` - Count in specific channel\n• `<p>count <guild_id> <channel_id> <message_id>` - Count in specific server/channel\n• `<p>count help` - Show detailed help\n\n**Examples:**\n• `<p>count 1234567890123456789`\n• `<p>count 987654321098765432 1234567890123456789`\n• `<p>count 111222333444555666 987654321098765432 1234567890123456789`",
+                "❌ **Usage:**\n• `<p>count <message_id>` - Count in current channel\n• `<p>count <channel_id> <message_id>` - Count in specific channel\n• `<p>count <guild_id> <channel_id> <message_id>` - Count in specific server/channel\n• `<p>count guild [guild_id] <message_id|date>` - Count in a whole server\n• `<p>count channels <id,id,...> <message_id|date>` - Count in several channels\n• `<p>count cancel` - Stop running counts\n• `<p>count stats` - Request statistics\n• `<p>count help` - Show detailed help\n\n**Examples:**\n• `<p>count 1234567890123456789`\n• `<p>count 987654321098765432 1234567890123456789`\n• `<p>count 111222333444555666 987654321098765432 1234567890123456789`",
                 "Message Counter"
             )
             return
         
-        parts = args.strip().split()
+        parts = []
+        options = {}
+        try:
+            lexer = shlex.shlex(args.strip(), posix=True)
+            lexer.whitespace_split = True
+            lexer.escape = ""  # keep regex backslashes intact
+            lexer.commenters = ""  # "#" is a normal character in patterns like --match=#general
+            tokens = list(lexer)
+        except ValueError:
+            tokens = args.strip().split()
+        
+        for part in tokens:
+            if part.startswith("--"):
+                name, separator, value = part[2:].partition("=")
+                options[name.lower()] = value if separator else True
+            else:
+                parts.append(part)
+        
+        if len(parts) == 1 and parts[0].lower() == "cancel":
+            if not active_scans:
+                await send_embed_safely(
+                    ctx.channel.id,
+                    "ℹ️ **No count is running.**",
+                    "Message Counter"
+                )
+                return
+            for scan in active_scans.values():
+                scan["cancel"].set()
+            print(f"Cancelling {len(active_scans)} running count(s)", type_="INFO")
+            return
+        
+        if len(parts) == 1 and parts[0].lower() == "stats":
+            if last_stats is None:
+                await send_embed_safely(
+                    ctx.channel.id,
+                    "ℹ️ **No count has run yet.** Statistics appear after the first count.",
+                    "Message Counter Stats"
+                )
+                return
+            await send_embed_safely(
+                ctx.channel.id,
+                f"""📡 **Count Statistics**
+
+**Last count:**
+{format_stats_details(last_stats)}
+
+**This session:**
+{format_stats_details(session_stats)}""",
+                "Message Counter Stats"
+            )
+            return
         
         if len(parts) == 1 and parts[0].lower() in ["help", "?", "-h", "--help"]:
             await send_embed_safely(
@@ -139,6 +1195,20 @@ Count messages between a specific message ID and now for safe purging operations
 • Counts messages in any server/channel combination
 • **Example:** `<p>count 111222333444555666 987654321098765432 1234567890123456789`
 
+**4. Whole Server / Channel List:**
+`<p>count guild [guild_id] <message_id|date>`
+`<p>count channels <channel_id,channel_id,...> <message_id|date>`
+• Counts every readable text channel (or the listed ones) after a message ID or date
+• Shows a per-channel breakdown and the total
+• **Example:** `<p>count guild 111222333444555666 2024-06-01`
+
+**🔎 Filters:**
+• `--author=me` or `--author=<user_id,...>` - Only these authors
+• `--bots` / `--no-bots` - Only / no bot messages
+• `--attachments` - Only messages with attachments
+• `--match="<regex>"` - Content matches (case-insensitive)
+• `--until=<message_id|date>` - Stop at this message or date (no extra cost)
+
 **🔍 How to get IDs:**
 • **Message ID:** Right-click message → Copy ID (need Developer Mode)
 • **Channel ID:** Right-click channel → Copy ID
@@ -149,16 +1219,127 @@ Count messages between a specific message ID and now for safe purging operations
 • Total messages to purge (including target)
 • Message author and time information
 • Safe count for bulk delete/purge commands
+• Purge plan: bulk-delete batches, messages to delete one by one, estimated time
+
+**⚡ Index:**
+• The first count in a channel indexes message IDs locally
+• Later counts only fetch messages newer than the index
+• Add `--fresh` to rebuild the channel's index from scratch
+• Add `--mode=scan` to walk history instead (repeat runs reuse the cached count)
+• Add `--mode=light` for the same walk reading only message IDs (faster, less memory)
+• Add `--mode=parallel` to scan time windows concurrently (`--workers=<n>`, max 8)
+
+**⏳ Long scans:**
+• Add `--progress` to see scanned messages, pages/s and an ETA while counting
+• `<p>count cancel` stops running counts and reports the partial count
+• `<p>count stats` shows page latency, rate-limit waits and throughput
 
 **💡 Pro Tips:**
 • Always test with a small range first
 • Discord bulk delete limit: 100 messages at once
-• Messages older than 14 days can't be bulk deleted
+• Messages older than 14 days can't be bulk deleted (the purge plan counts them separately)
 • Use the "Total to purge" number for your purge command""",
                 "Message Counter Help"
             )
             return
         
+        mode = str(options.get("mode", "index")).lower()
+        if mode not in COUNT_MODES:
+            await send_embed_safely(
+                ctx.channel.id,
+                f"❌ **Unknown mode:** `{mode}`\n\n**Available modes:** {', '.join(COUNT_MODES)}",
+                "Message Counter"
+            )
+            return
+        
+        try:
+            workers = int(options.get("workers", PARALLEL_DEFAULT_WORKERS))
+        except ValueError:
+            await send_embed_safely(
+                ctx.channel.id,
+                "❌ **Invalid worker count.** `--workers` must be a number.",
+                "Message Counter"
+            )
+            return
+        
+        scan = new_scan(min(max(workers, 1), PARALLEL_MAX_WORKERS))
+        
+        try:
+            filter_info = compile_filters(options, scan)
+        except ValueError as e:
+            await send_embed_safely(
+                ctx.channel.id,
+                f"❌ **Invalid filter:** {str(e)}\n\nSee `<p>count help` for the filter options.",
+                "Message Counter"
+            )
+            return
+        
+        if parts and parts[0].lower() in ["guild", "channels"]:
+            if parts[0].lower() == "guild" and len(parts) in [2, 3]:
+                try:
+                    target_guild = bot.get_guild(int(parts[1])) if len(parts) == 3 else ctx.guild
+                except ValueError:
+                    target_guild = None
+                if not target_guild:
+                    await send_embed_safely(
+                        ctx.channel.id,
+                        "❌ **Server not found.** Provide a server ID you are in, or run this inside a server.",
+                        "Message Counter"
+                    )
+                    return
+                channels = []
+                for channel in target_guild.text_channels:
+                    try:
+                        if channel.permissions_for(target_guild.me).read_message_history:
+                            channels.append(channel)
+                    except Exception:
+                        channels.append(channel)
+                location_info = f"{len(channels)} channel(s) in {target_guild.name}"
+            elif parts[0].lower() == "channels" and len(parts) == 3:
+                channels = []
+                for channel_id in parts[1].split(","):
+                    try:
+                        channel = bot.get_channel(int(channel_id))
+                    except ValueError:
+                        channel = None
+                    if not channel:
+                        await send_embed_safely(
+                            ctx.channel.id,
+                            f"❌ **Channel not found.** Cannot access channel with ID `{channel_id}`.",
+                            "Message Counter"
+                        )
+                        return
+                    channels.append(channel)
+                location_info = f"{len(channels)} channel(s)"
+            else:
+                await send_embed_safely(
+                    ctx.channel.id,
+                    "❌ **Invalid arguments.** Please use one of these formats:\n• `<p>count guild [guild_id] <message_id|date>`\n• `<p>count channels <channel_id,channel_id,...> <message_id|date>`",
+                    "Message Counter"
+                )
+                return
+            
+            try:
+                after_id = parse_start_point(parts[-1])
+            except ValueError:
+                await send_embed_safely(
+                    ctx.channel.id,
+                    "❌ **Invalid start point.** Use a message ID/snowflake or a date like `2024-06-01` or `2024-06-01T12:00`.",
+                    "Message Counter"
+                )
+                return
+            
+            try:
+                await count_multi_channel(ctx, channels, after_id, location_info, mode, scan, options, filter_info)
+            except Exception as e:
+                await send_embed_safely(
+                    ctx.channel.id,
+                    f"❌ **Unexpected Error:** {str(e)}\n\nPlease try again or contact support if the issue persists.",
+                    "Message Counter"
+                )
+                print(f"Unexpected error during multi-channel counting: {str(e)}", type_="ERROR")
+            return
+        
         if len(parts) == 1:
             message_id = parts[0]
             target_channel = ctx.channel
@@ -252,11 +1433,74 @@ Count messages between a specific message ID and now for safe purging operations
                 )
                 return
             
-            message_count = 0
-            async for message in target_channel.history(after=target_message, limit=None):
-                message_count += 1
+            if "fresh" in options:
+                index_drop_channel(target_channel.id)
+                count_cache_drop_channel(target_channel.id)
             
-            total_purge_count = message_count + 1
+            progress_message = None
+            progress_task = None
+            if "progress" in options:
+                progress_message = await ctx.send(format_progress(scan, location_info))
+                progress_task = asyncio.create_task(report_progress(progress_message, scan, location_info))
+            
+            scan["channel_id"] = target_channel.id
+            active_scans[ctx.message.id] = scan
+            try:
+                result = await pick_count_mode(mode, scan)(target_channel, target_message.id, scan)
+            except ScanCancelled:
+                counted = partial_count(scan)
+                elapsed = format_duration(time.monotonic() - scan["started_at"])
+                await send_embed_safely(
+                    ctx.channel.id,
+                    f"""🛑 **Count cancelled**
+
+**Target Message:** `{message_id}` by {target_author}
+**Location:** {location_info}
+
+• Scanned **{scan['scanned']:,}** message(s) in {scan['pages']:,} page(s) over {elapsed}
+• Partial count: at least **{counted:,}** message(s) after target
+
+**📡 Requests:** {format_stats_summary(scan['stats'])}""",
+                    "Message Counter"
+                )
+                print(f"Count cancelled after {scan['scanned']} scanned messages (partial count {counted})", type_="INFO")
+                return
+            finally:
+                active_scans.pop(ctx.message.id, None)
+                finish_stats(scan)
+                if progress_task:
+                    progress_task.cancel()
+                if progress_message:
+                    try:
+                        await progress_message.delete()
+                    except discord.HTTPException:
+                        pass
+            
+            message_count = result["count"]
+            target_included = scan["predicate"] is None or scan["predicate"](message_payload(target_message))
+            plan = build_purge_plan(
+                message_count,
+                result["old_count"],
+                target_message.id if target_included else None,
+                scan["cutoff_id"]
+            )
+            
+            if result["source"] == "index":
+                source_info = f"local index ({result['fetched']:,} new message(s) fetched)"
+            elif result["source"] == "cache":
+                source_info = f"cached count (+{result['fetched']:,} new message(s) fetched)"
+            elif result["source"] == "parallel":
+                source_info = f"parallel scan ({result['fetched']:,} message(s) fetched across {result['windows']} windows, {scan['workers']} workers)"
+            elif result["source"] == "light":
+                source_info = f"ID-only scan ({result['fetched']:,} message(s) fetched)"
+            elif result["source"] == "filtered":
+                source_info = f"filtered scan ({result['fetched']:,} message(s) checked)"
+            else:
+                source_info = f"history scan ({result['fetched']:,} message(s) fetched)"
+            
+            total_purge_count = message_count + (1 if target_included else 0)
+            target_note = "including target" if target_included else "target doesn't match the filters"
+            filter_line = f"\n**🔎 Filters:** {filter_info}" if filter_info else ""
             
             target_time_formatted = format_timestamp(target_timestamp)
             target_time_ago = format_time_ago(target_timestamp)
@@ -266,11 +1510,19 @@ Count messages between a specific message ID and now for safe purging operations
 
 **Target Message:** `{message_id}` by {target_author}
 **Location:** {location_info}
-**Time:** {target_time_ago}
+**Time:** {target_time_ago}{filter_line}
 
 **📈 Count:**
 • Messages after target: **{message_count:,}**
-• **Total to purge: {total_purge_count:,}** (including target)
+• **Total to purge: {total_purge_count:,}** ({target_note})
+
+**🧹 Purge Plan:**
+• Bulk delete: **{plan['bulk_count']:,}** message(s) in **{plan['bulk_batches']:,}** batch(es) of up to {PURGE_BULK_LIMIT}
+• One by one: **{plan['single_count']:,}** message(s) (older than {PURGE_BULK_MAX_AGE_DAYS} days, or too few for a bulk batch)
+• Estimated delete time: ~{format_duration(plan['estimated_seconds'])}
+
+**⚡ Source:** {source_info}
+**📡 Requests:** {format_stats_summary(scan['stats'])}
 
 💡 Use `{total_purge_count}` for your purge command."""
 